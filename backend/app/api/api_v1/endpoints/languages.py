@@ -1,26 +1,93 @@
 """
 Languages API endpoints.
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
+from itertools import permutations
 from typing import List, Dict, Any
-from datetime import datetime
+import hashlib
+import orjson
 
 from app.models.language import (
     get_supported_languages,
     get_language_by_code
 )
+from app.services.language_detector import detect_language as detect_text_language
+from app.core.clock import utc_now_iso
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 router = APIRouter()
 
+# For now, all language pairs are supported by mock translator. The list is
+# shared by every pair entry and must not be mutated.
+_MOCK_MODELS = ["mock"]
+
+
+def _build_language_info(lang) -> Dict[str, Any]:
+    """Build the public representation of a language."""
+    return {
+        "code": lang.code,
+        "name": lang.name,
+        "native_name": lang.native_name,
+        "script": lang.script_type,
+        "direction": lang.direction,
+        "family": "unknown",  # Not available in current model
+        "region": "unknown",  # Not available in current model
+        "supported_models": [],  # Not available in current model
+        "is_rtl": lang.direction == "rtl"
+    }
+
+
+def _build_pairs(languages) -> List[Dict[str, Any]]:
+    """Build all source-target pairs for the given languages."""
+    # permutations never pairs a language with itself, so every pair is valid
+    return [
+        {
+            "source": source.code,
+            "target": target.code,
+            "source_name": source.name,
+            "target_name": target.name,
+            "supported_models": _MOCK_MODELS,
+            "bidirectional": True  # All pairs are bidirectional
+        }
+        for source, target in permutations(languages, 2)
+    ]
+
+
+# The supported language set is static, so the response bodies are built
+# once at import time and only the timestamp is stamped per request.
+_LANGUAGE_LIST = [_build_language_info(lang) for lang in get_supported_languages()]
+_LANGUAGES_PAYLOAD = {
+    "languages": _LANGUAGE_LIST,
+    "total": len(_LANGUAGE_LIST)
+}
+# Pre-encoded languages body without its closing brace; only the timestamp
+# is appended per request
+_LANGUAGES_JSON_HEAD = orjson.dumps(_LANGUAGES_PAYLOAD)[:-1]
+# Strong validator for the language list; the per-request timestamp is not
+# part of the cached representation
+_LANGUAGES_ETAG = '"' + hashlib.md5(orjson.dumps(_LANGUAGES_PAYLOAD)).hexdigest() + '"'
+_LANGUAGES_CACHE_HEADERS = {
+    "ETag": _LANGUAGES_ETAG,
+    "Cache-Control": "public, max-age=300"
+}
+
+_PAIRS_LIST = _build_pairs(get_supported_languages())
+_PAIRS_PAYLOAD = {
+    "language_pairs": _PAIRS_LIST,
+    "total": len(_PAIRS_LIST)
+}
+# Pre-encoded pairs body without its closing brace; only the timestamp is
+# appended per request
+_PAIRS_JSON_HEAD = orjson.dumps(_PAIRS_PAYLOAD)[:-1]
+
 
 @router.get(
     "/",
     summary="Get supported languages",
     description="Get list of all supported languages with their metadata"
 )
-async def get_languages():
+async def get_languages(request: Request):
     """
     Get all supported languages.
     
@@ -30,33 +97,21 @@ async def get_languages():
     - Writing script and direction
     - Language family
     - Supported translation models
+    
+    Responses carry an ETag; a matching If-None-Match yields 304 Not Modified.
     """
     try:
-        languages = get_supported_languages()
+        if request.headers.get("if-none-match") == _LANGUAGES_ETAG:
+            return Response(status_code=304, headers=_LANGUAGES_CACHE_HEADERS)
         
-        language_list = []
-        for lang in languages:
-            language_info = {
-                "code": lang.code,
-                "name": lang.name,
-                "native_name": lang.native_name,
-                "script": lang.script_type,
-                "direction": lang.direction,
-                "family": "unknown",  # Not available in current model
-                "region": "unknown",  # Not available in current model
-                "supported_models": [],  # Not available in current model
-                "is_rtl": lang.direction == "rtl"
-            }
-            language_list.append(language_info)
-        
-        return {
-            "languages": language_list,
-            "total": len(language_list),
-            "timestamp": datetime.utcnow()
-        }
+        return Response(
+            content=_LANGUAGES_JSON_HEAD + b',"timestamp":"' + utc_now_iso().encode() + b'"}',
+            media_type="application/json",
+            headers=_LANGUAGES_CACHE_HEADERS
+        )
         
     except Exception as e:
-        logger.error(f"Error retrieving languages: {str(e)}")
+        logger.error("Error retrieving languages", extra={"error": str(e)}, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail="Error retrieving supported languages"
@@ -83,24 +138,20 @@ async def get_language_details(language_code: str):
             )
         
         return {
-            "code": language.code,
-            "name": language.name,
-            "native_name": language.native_name,
-            "script": language.script_type,
-            "direction": language.direction,
-            "family": "unknown",  # Not available in current model
-            "region": "unknown",  # Not available in current model
-            "supported_models": [],  # Not available in current model
-            "is_rtl": language.direction == "rtl",
+            **_build_language_info(language),
             "character_set": "unknown",  # Not available in current model
             "writing_system": "unknown",  # Not available in current model
-            "timestamp": datetime.utcnow()
+            "timestamp": utc_now_iso()
         }
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving language details for {language_code}: {str(e)}")
+        logger.error(
+            "Error retrieving language details",
+            extra={"language_code": language_code, "error": str(e)},
+            exc_info=True
+        )
         raise HTTPException(
             status_code=500,
             detail="Error retrieving language details"
@@ -120,34 +171,13 @@ async def get_supported_pairs():
     along with the models that support each pair.
     """
     try:
-        languages = get_supported_languages()
-        language_codes = [lang.code for lang in languages]
-        
-        pairs = []
-        for source in language_codes:
-            for target in language_codes:
-                if source != target:  # Can't translate to same language
-                    source_lang = get_language_by_code(source)
-                    target_lang = get_language_by_code(target)
-                    
-                    # For now, all language pairs are supported by mock translator
-                    pairs.append({
-                        "source": source,
-                        "target": target,
-                        "source_name": source_lang.name if source_lang else source,
-                        "target_name": target_lang.name if target_lang else target,
-                        "supported_models": ["mock"],  # Mock translator supports all pairs
-                        "bidirectional": True  # All pairs are bidirectional
-                    })
-        
-        return {
-            "language_pairs": pairs,
-            "total": len(pairs),
-            "timestamp": datetime.utcnow()
-        }
+        return Response(
+            content=_PAIRS_JSON_HEAD + b',"timestamp":"' + utc_now_iso().encode() + b'"}',
+            media_type="application/json"
+        )
         
     except Exception as e:
-        logger.error(f"Error retrieving language pairs: {str(e)}")
+        logger.error("Error retrieving language pairs", extra={"error": str(e)}, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail="Error retrieving supported language pairs"
@@ -181,22 +211,28 @@ async def detect_language(text: str):
         )
     
     try:
-        # Language detection service not implemented yet
-        # Return a mock response for now
+        predictions = detect_text_language(text)
+        
+        if predictions:
+            best = predictions[0]
+        else:
+            # No characters from a supported script, default to English
+            best = {"language": "en", "confidence": 0.0}
+        
         return {
             "text": text[:100] + "..." if len(text) > 100 else text,
-            "detected_language": "en",  # Default to English
-            "confidence": 0.5,  # Low confidence since it's mocked
-            "all_predictions": [{"language": "en", "confidence": 0.5}],
+            "detected_language": best["language"],
+            "confidence": best["confidence"],
+            "all_predictions": predictions or [best],
             "is_supported": True,
-            "timestamp": datetime.utcnow()
+            "timestamp": utc_now_iso()
         }
-        raise HTTPException(
-            status_code=503,
-            detail="Language detection service temporarily unavailable"
-        )
     except Exception as e:
-        logger.error(f"Error in language detection: {str(e)}")
+        logger.error(
+            "Error in language detection",
+            extra={"text_length": len(text), "error": str(e)},
+            exc_info=True
+        )
         raise HTTPException(
             status_code=500,
             detail="Error detecting language"
@@ -2,11 +2,10 @@
 Translation API endpoints for the NLP Translation service.
 """
 from typing import List, Optional
-from datetime import datetime
-from fastapi import APIRouter, HTTPException, Depends, Request, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 import time
-import asyncio
 
 from app.models.translation import (
     TranslationRequest,
@@ -17,6 +16,8 @@ from app.models.translation import (
     ModelInfo
 )
 from app.services.translation_service import TranslationService, get_translation_service
+from app.services.translation_pipeline import translate_with_cache
+from app.core.clock import utc_now_iso
 from app.core.logging import get_translation_logger, get_logger
 
 router = APIRouter()
@@ -50,83 +51,21 @@ async def translate_text(
     Returns:
         TranslationResponse: Contains translated text and metadata
     """
-    start_time = time.time()
-    
-    # Log translation request
-    translation_logger.log_translation_request(
-        source_text=request.text,
-        source_lang=request.source_language,
-        target_lang=request.target_language,
-        model=request.model or "auto"
-    )
+    model = request.model or "auto"
     
     try:
-        # Check cache first
-        cache_key = None
-        if cache_service:
-            cache_key = cache_service.generate_cache_key(
-                text=request.text,
-                source_lang=request.source_language,
-                target_lang=request.target_language,
-                model=request.model or "auto"
-            )
-            
-            cached_result = await cache_service.get(cache_key)
-            if cached_result:
-                translation_logger.log_cache_hit(
-                    cache_key=cache_key,
-                    source_lang=request.source_language,
-                    target_lang=request.target_language
-                )
-                
-                # Add processing time to cached result
-                cached_result["processing_time"] = time.time() - start_time
-                return TranslationResponse(**cached_result)
-            else:
-                translation_logger.log_cache_miss(
-                    cache_key=cache_key,
-                    source_lang=request.source_language,
-                    target_lang=request.target_language
-                )
-        
-        # Perform translation
-        result = await translation_service.translate(
+        response_data = await translate_with_cache(
             text=request.text,
             source_language=request.source_language,
             target_language=request.target_language,
-            model=request.model
-        )
-        
-        processing_time = time.time() - start_time
-        
-        # Prepare response
-        response = TranslationResponse(
-            translated_text=result.translated_text,
-            source_language=request.source_language,
-            target_language=request.target_language,
-            confidence_score=result.confidence,
-            model_used=result.model_used,
-            processing_time=processing_time,
-            cached=False,
-            detected_language=result.detected_language
-        )
-        
-        # Cache the result
-        if cache_service and cache_key:
-            await cache_service.set(cache_key, response.dict())
-        
-        # Log successful translation
-        translation_logger.log_translation_response(
-            source_text=request.text,
-            translated_text=result.translated_text,
-            source_lang=request.source_language,
-            target_lang=request.target_language,
-            model=result.model_used,
-            confidence=result.confidence,
-            processing_time=processing_time
+            model=model,
+            cache_service=cache_service,
+            translation_service=translation_service,
+            translation_logger=translation_logger
         )
-        
-        return response
+        # The body is built server-side, so it bypasses response_model
+        # validation; response_model still documents the schema
+        return ORJSONResponse(content=response_data)
         
     except Exception as e:
         # Log translation error
@@ -134,7 +73,7 @@ async def translate_text(
             source_text=request.text,
             source_lang=request.source_language,
             target_lang=request.target_language,
-            model=request.model or "auto",
+            model=model,
             error=str(e)
         )
         
@@ -146,18 +85,22 @@ async def translate_text(
 
 @router.post(
     "/batch",
-    response_model=List[TranslationResponse],
+    responses={200: {"model": List[TranslationResponse]}},
     summary="Batch translate multiple texts",
     description="Translate multiple texts in a single request for better efficiency"
 )
 async def batch_translate(
     requests: List[TranslationRequest],
-    background_tasks: BackgroundTasks
-) -> List[TranslationResponse]:
+    translation_service: TranslationService = Depends(get_translation_service),
+    cache_service = Depends(get_cache_service)
+) -> ORJSONResponse:
     """
     Batch translate multiple texts.
     
-    Processes up to 10 translation requests in parallel for better efficiency.
+    Processes up to 10 translation requests at once. Identical requests are
+    translated only once, cache lookups and writes are done in bulk, and
+    cache misses sharing a language pair and model are sent to the
+    translation service as a single batch.
     Each request follows the same format as the single translation endpoint.
     """
     if len(requests) > 10:
@@ -172,50 +115,131 @@ async def batch_translate(
             detail="At least one translation request is required"
         )
     
+    start_time = time.perf_counter()
+    
     try:
-        logger.info("Batch translation request", batch_size=len(requests))
+        logger.info("Batch translation request", extra={"batch_size": len(requests)})
         
-        # Process translations concurrently
-        tasks = []
+        # Deduplicate identical requests, remembering which unique slot
+        # each original item maps to
+        slots = {}
+        item_slots = []
         for request in requests:
-            task = translate_text(request, background_tasks)
-            tasks.append(task)
+            key = (
+                request.text,
+                request.source_language,
+                request.target_language,
+                request.model or "auto"
+            )
+            item_slots.append(slots.setdefault(key, len(slots)))
+        unique_requests = list(slots)
+        
+        # Response data per unique request (None until resolved)
+        results: List[Optional[dict]] = [None] * len(unique_requests)
+        
+        # Check cache for all unique requests in one call
+        cache_keys = None
+        if cache_service:
+            cache_keys = [
+                cache_service.generate_cache_key(
+                    text=text,
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                    model=model
+                )
+                for text, source_lang, target_lang, model in unique_requests
+            ]
+            cached_results = await cache_service.mget(cache_keys)
+            for slot, cached_result in enumerate(cached_results):
+                if cached_result:
+                    _, source_lang, target_lang, _ = unique_requests[slot]
+                    results[slot] = {
+                        **cached_result,
+                        "source_language": source_lang,
+                        "target_language": target_lang,
+                        "cached": True
+                    }
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Group cache misses by language pair and model
+        groups = {}
+        for slot, (text, source_lang, target_lang, model) in enumerate(unique_requests):
+            if results[slot] is None:
+                groups.setdefault((source_lang, target_lang, model), []).append(slot)
         
-        # Handle any exceptions in the batch
+        # Translate each group with a single batch call
+        to_cache = {}
+        for (source_lang, target_lang, model), group_slots in groups.items():
+            try:
+                translated = await translation_service.translate_batch(
+                    texts=[unique_requests[slot][0] for slot in group_slots],
+                    source_language=source_lang,
+                    target_language=target_lang,
+                    model=model
+                )
+            except Exception as e:
+                logger.error(
+                    "Batch group failed",
+                    extra={
+                        "source_lang": source_lang,
+                        "target_lang": target_lang,
+                        "model": model,
+                        "error": str(e)
+                    }
+                )
+                continue
+            
+            for slot, result in zip(group_slots, translated):
+                results[slot] = {
+                    "translated_text": result.translated_text,
+                    "source_language": source_lang,
+                    "target_language": target_lang,
+                    "confidence_score": result.confidence,
+                    "model_used": result.model_used,
+                    "processing_time": 0.0,
+                    "cached": False,
+                    "detected_language": result.detected_language
+                }
+                if cache_keys:
+                    to_cache[cache_keys[slot]] = results[slot]
+        
+        if to_cache:
+            await cache_service.mset(to_cache)
+        
+        # Scatter unique results back to the original request order
+        processing_time = time.perf_counter() - start_time
         responses = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Batch item {i} failed", error=str(result))
+        for request, slot in zip(requests, item_slots):
+            data = results[slot]
+            if data is None:
                 # Return error response for failed items
-                error_response = TranslationResponse(
-                    translated_text="",
-                    confidence=0.0,
-                    model_used="error",
-                    processing_time_ms=0,
-                    alternatives=[],
-                    cached=False
-                )
-                responses.append(error_response)
-            else:
-                responses.append(result)
+                data = {
+                    "translated_text": "",
+                    "source_language": request.source_language,
+                    "target_language": request.target_language,
+                    "confidence_score": 0.0,
+                    "model_used": "error",
+                    "cached": False,
+                    "detected_language": None
+                }
+            # Items are built here in the TranslationResponse JSON shape, so
+            # they are serialized as-is rather than validated one by one
+            responses.append({**data, "processing_time": processing_time})
         
-        logger.info("Batch translation completed", batch_size=len(responses))
-        return responses
+        logger.info("Batch translation completed", extra={"batch_size": len(responses)})
+        return ORJSONResponse(content=responses)
         
     except Exception as e:
-        logger.error("Batch translation error", error=str(e), exc_info=True)
+        logger.error("Batch translation error", extra={"error": str(e)}, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail="Internal server error during batch translation"
         )
 
 
-@router.get("/models", response_model=List[ModelInfo])
+@router.get("/models", responses={200: {"model": List[ModelInfo]}})
 async def get_available_models(
     translation_service: TranslationService = Depends(get_translation_service)
-):
+) -> ORJSONResponse:
     """
     Get information about available translation models.
     
@@ -224,18 +248,22 @@ async def get_available_models(
     """
     try:
         models = await translation_service.get_available_models()
-        return [
-            ModelInfo(
-                name=model["name"],
-                source_languages=model.get("supported_languages", []),
-                target_languages=model.get("supported_languages", []),
-                description=model["description"],
-                timestamp=datetime.utcnow()
-            )
+        # Built straight into the ModelInfo JSON shape; the schema is kept
+        # for OpenAPI only, as there is nothing here to validate
+        timestamp = utc_now_iso()
+        model_infos = [
+            {
+                "name": model["name"],
+                "source_languages": model.get("supported_languages", []),
+                "target_languages": model.get("supported_languages", []),
+                "description": model["description"],
+                "timestamp": timestamp
+            }
             for model in models
         ]
+        return ORJSONResponse(content=model_infos)
     except Exception as e:
-        logger.error(f"Error retrieving models: {str(e)}")
+        logger.error("Error retrieving models", extra={"error": str(e)}, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to retrieve models: {str(e)}"
@@ -250,7 +278,7 @@ async def get_available_models(
 async def get_translation_stats(
     translation_service: TranslationService = Depends(get_translation_service),
     cache_service = Depends(get_cache_service)
-):
+) -> ORJSONResponse:
     """
     Get translation service statistics.
     
@@ -266,13 +294,13 @@ async def get_translation_stats(
         if cache_service:
             cache_stats = await cache_service.get_stats()
         
-        return {
+        return ORJSONResponse(content={
             "translation_stats": stats,
             "cache_stats": cache_stats,
-            "timestamp": datetime.utcnow()
-        }
+            "timestamp": utc_now_iso()
+        })
     except Exception as e:
-        logger.error("Error retrieving stats", error=str(e))
+        logger.error("Error retrieving stats", extra={"error": str(e)}, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail="Error retrieving statistics"
@@ -0,0 +1,29 @@
+"""
+Cached wall-clock timestamps for hot request paths.
+"""
+import time
+from datetime import datetime, timezone
+
+# How long a formatted timestamp is reused before being refreshed
+_REFRESH_INTERVAL_SECONDS = 0.1
+
+_cached_iso = ""
+_cached_at = float("-inf")
+
+
+def utc_now_iso() -> str:
+    """
+    Get the current UTC time as an ISO 8601 string.
+
+    The formatted value is refreshed at most every 100 ms (tracked with the
+    monotonic clock), so callers on hot paths share one string instead of
+    building a datetime per request.
+    """
+    global _cached_iso, _cached_at
+
+    now = time.monotonic()
+    if now - _cached_at >= _REFRESH_INTERVAL_SECONDS:
+        # Naive UTC, so the string keeps its format (no "+00:00" suffix)
+        _cached_iso = datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+        _cached_at = now
+    return _cached_iso
@@ -3,23 +3,60 @@ Logging configuration for the NLP translation application.
 """
 import logging
 import logging.config
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict, Any
-import json
-from datetime import datetime
+from typing import Dict, Any, Optional, Set
+from datetime import datetime, timezone
+
+import orjson
+
+
+# Log directories already created by setup_logging
+_created_log_dirs: Set[Path] = set()
+
+# Background listener writing file log records, if file logging is enabled
+_queue_listener: Optional[QueueListener] = None
+
+# LogRecord attributes that are not user-supplied extras
+_RESERVED_RECORD_ATTRS = frozenset({
+    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+    'filename', 'module', 'exc_info', 'exc_text', 'stack_info',
+    'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
+    'thread', 'threadName', 'processName', 'process', 'taskName',
+    'getMessage'
+})
 
 
 class StructuredFormatter(logging.Formatter):
     """Custom formatter for structured logging."""
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Formatted timestamp of the last millisecond seen
+        self._last_millis = None
+        self._last_timestamp = ""
+    
+    def _format_timestamp(self, created: float) -> str:
+        """Format a record creation time, reusing it within the same millisecond."""
+        millis = int(created * 1000)
+        if millis != self._last_millis:
+            self._last_timestamp = (
+                datetime.fromtimestamp(created, timezone.utc).replace(tzinfo=None)
+                .isoformat(timespec="milliseconds") + "Z"
+            )
+            self._last_millis = millis
+        return self._last_timestamp
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as structured JSON."""
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
-            "message": record.getMessage(),
+            # Only run %-formatting when there are args to interpolate
+            "message": record.getMessage() if record.args else str(record.msg),
             "module": record.module,
             "function": record.funcName,
             "line": record.lineno
@@ -30,16 +67,13 @@ class StructuredFormatter(logging.Formatter):
             log_data["exception"] = self.formatException(record.exc_info)
         
         # Add extra fields from the log record
-        for key, value in record.__dict__.items():
-            if key not in {
-                'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
-                'filename', 'module', 'exc_info', 'exc_text', 'stack_info',
-                'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
-                'thread', 'threadName', 'processName', 'process', 'getMessage'
-            }:
-                log_data[key] = value
+        log_data.update({
+            key: value
+            for key, value in record.__dict__.items()
+            if key not in _RESERVED_RECORD_ATTRS
+        })
         
-        return json.dumps(log_data, default=str)
+        return orjson.dumps(log_data, default=str).decode()
 
 
 class TranslationLogger:
@@ -57,6 +91,8 @@ class TranslationLogger:
         user_id: str = None
     ):
         """Log translation request."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         self.logger.info(
             "Translation request received",
             extra={
@@ -81,6 +117,8 @@ class TranslationLogger:
         user_id: str = None
     ):
         """Log translation response."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         self.logger.info(
             "Translation completed",
             extra={
@@ -121,6 +159,8 @@ class TranslationLogger:
     
     def log_cache_hit(self, cache_key: str, source_lang: str, target_lang: str):
         """Log cache hit."""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         self.logger.debug(
             "Cache hit",
             extra={
@@ -133,6 +173,8 @@ class TranslationLogger:
     
     def log_cache_miss(self, cache_key: str, source_lang: str, target_lang: str):
         """Log cache miss."""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         self.logger.debug(
             "Cache miss",
             extra={
@@ -159,10 +201,17 @@ def setup_logging(
         structured_logging: Whether to use structured JSON logging
         console_logging: Whether to enable console logging
     """
+    global _queue_listener
+    
     # Create logs directory if log file is specified
     if log_file:
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log_dir = Path(log_file).parent
+        if log_dir not in _created_log_dirs:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            _created_log_dirs.add(log_dir)
+    
+    # Stop the file writer of a previous configuration
+    shutdown_logging()
     
     # Configure handlers
     handlers = []
@@ -182,16 +231,25 @@ def setup_logging(
     
     if log_file:
         if structured_logging:
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setFormatter(StructuredFormatter())
+            file_formatter = StructuredFormatter()
         else:
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setFormatter(
-                logging.Formatter(
-                    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-                )
+            file_formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
             )
-        handlers.append(file_handler)
+        
+        # Records are formatted by the queue handler; the file handler
+        # only writes them, on the listener's background thread, so
+        # request handlers never block on disk I/O
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(logging.Formatter('%(message)s'))
+        
+        log_queue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(file_formatter)
+        
+        _queue_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _queue_listener.start()
+        handlers.append(queue_handler)
     
     # Configure root logger
     logging.basicConfig(
@@ -217,6 +275,17 @@ def setup_logging(
     )
 
 
+def shutdown_logging() -> None:
+    """Flush queued file log records and stop the background writer."""
+    global _queue_listener
+    
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the given name."""
     return logging.getLogger(name)
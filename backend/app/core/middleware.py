@@ -0,0 +1,210 @@
+"""
+ASGI middleware for the NLP translation application.
+"""
+import time
+from typing import Iterable, Optional
+
+from starlette.responses import HTMLResponse, PlainTextResponse
+
+from app.core.logging import PerformanceLogger
+
+# Methods allowed for cross-origin requests (CORS allow_methods=["*"])
+_CORS_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+_PREFLIGHT_VARY = (
+    b"Origin, Access-Control-Request-Method, Access-Control-Request-Headers, "
+    b"Access-Control-Request-Private-Network"
+)
+
+# Performance logger used for per-request metrics, bound at app startup
+_performance_logger: Optional[PerformanceLogger] = None
+
+
+def set_performance_logger(performance_logger: Optional[PerformanceLogger]) -> None:
+    """Bind (or with None, unbind) the logger receiving per-request metrics."""
+    global _performance_logger
+    _performance_logger = performance_logger
+
+
+class EdgeMiddleware:
+    """
+    Host validation, CORS and request timing in a single ASGI layer.
+
+    Replaces the TrustedHostMiddleware / CORSMiddleware / timing middleware
+    stack with one pass over the request headers per call. Behaviour matches
+    the previous configuration: hosts outside the allowlist get a 400,
+    cross-origin requests from allowed origins are answered with credentials
+    enabled and all methods and headers allowed, and every response carries
+    an X-Process-Time header and is logged through the performance logger.
+    Headers are injected into the ``http.response.start`` message as it is
+    sent, so no Request/Response objects are built for normal requests.
+    """
+
+    def __init__(
+        self,
+        app,
+        allowed_hosts: Iterable[str],
+        allow_origins: Iterable[str],
+        max_age: int = 600
+    ):
+        """
+        Args:
+            app: Downstream ASGI application
+            allowed_hosts: Host names to accept; "*.domain" matches subdomains
+                and "*" disables the check
+            allow_origins: Origins allowed to make cross-origin requests
+            max_age: Seconds browsers may cache a preflight response
+        """
+        allowed_hosts = list(allowed_hosts)
+        self.app = app
+        self.allow_any_host = "*" in allowed_hosts
+        self.allowed_hosts = frozenset(host for host in allowed_hosts if not host.startswith("*."))
+        self.allowed_host_suffixes = tuple(host[1:] for host in allowed_hosts if host.startswith("*."))
+        self.allow_origins = frozenset(origin.encode("latin-1") for origin in allow_origins)
+        self.preflight_headers = [
+            (b"vary", _PREFLIGHT_VARY),
+            (b"access-control-allow-methods", _CORS_METHODS),
+            (b"access-control-max-age", str(max_age).encode()),
+            (b"access-control-allow-credentials", b"true"),
+        ]
+
+    def _is_allowed_host(self, host: bytes) -> bool:
+        """Check the Host header (port stripped) against the allowlist."""
+        if self.allow_any_host:
+            return True
+        name = host.decode("latin-1").split(":")[0]
+        return name in self.allowed_hosts or name.endswith(self.allowed_host_suffixes)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+
+        host = b""
+        origin = None
+        request_method = None
+        request_headers = None
+        request_private_network = None
+        for name, value in scope["headers"]:
+            if name == b"host":
+                host = value
+            elif name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+            elif name == b"access-control-request-private-network":
+                request_private_network = value
+
+        add_cors_headers = False
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                process_time = time.perf_counter() - start_time
+
+                headers = list(message.get("headers", ()))
+                if add_cors_headers:
+                    self._add_cors_headers(headers, origin)
+                headers.append((b"x-process-time", f"{process_time:.6f}".encode()))
+                message["headers"] = headers
+
+                # Log performance metrics
+                performance_logger = _performance_logger
+                if performance_logger is not None:
+                    performance_logger.log_api_request(
+                        endpoint=scope["path"],
+                        method=scope["method"],
+                        response_time=process_time,
+                        status_code=message["status"]
+                    )
+
+            await send(message)
+
+        if not self._is_allowed_host(host):
+            response = PlainTextResponse("Invalid host header", status_code=400)
+            await response(scope, receive, send_wrapper)
+            return
+
+        if origin is not None and request_method is not None and scope["method"] == "OPTIONS":
+            response = self._preflight_response(origin, request_headers, request_private_network)
+            await response(scope, receive, send_wrapper)
+            return
+
+        add_cors_headers = True
+        await self.app(scope, receive, send_wrapper)
+
+    def _preflight_response(self, origin: bytes, request_headers, request_private_network) -> PlainTextResponse:
+        """Answer a CORS preflight request."""
+        headers = list(self.preflight_headers)
+        failures = []
+
+        if origin in self.allow_origins:
+            headers.append((b"access-control-allow-origin", origin))
+        else:
+            failures.append("origin")
+
+        # All headers are allowed, so requested headers are mirrored back
+        if request_headers is not None:
+            headers.append((b"access-control-allow-headers", request_headers))
+
+        if request_private_network is not None:
+            failures.append("private-network")
+
+        if failures:
+            response = PlainTextResponse("Disallowed CORS " + ", ".join(failures), status_code=400)
+        else:
+            response = PlainTextResponse("OK", status_code=200)
+        response.raw_headers.extend(headers)
+        return response
+
+    def _add_cors_headers(self, headers: list, origin) -> None:
+        """Add CORS headers to a response for a simple (non-preflight) request."""
+        if origin is not None:
+            headers.append((b"access-control-allow-credentials", b"true"))
+            if origin in self.allow_origins:
+                headers.append((b"access-control-allow-origin", origin))
+
+        # Responses differ by Origin, so caches must key on it
+        vary = [value for name, value in headers if name.lower() == b"vary"]
+        if vary:
+            headers[:] = [(name, value) for name, value in headers if name.lower() != b"vary"]
+        vary.append(b"Origin")
+        headers.append((b"vary", b", ".join(vary)))
+
+
+class ProfilerMiddleware:
+    """
+    Profile a request on demand when it carries a ``profile=1`` query parameter.
+
+    The downstream response is discarded and replaced by pyinstrument's HTML
+    call-tree report. Requests without the parameter pass straight through.
+    Only registered when profiling is enabled in settings.
+    """
+
+    def __init__(self, app, interval: float = 0.001):
+        # Development-only dependency, imported only when profiling is enabled
+        from pyinstrument import Profiler
+
+        self.app = app
+        self.interval = interval
+        self._profiler_class = Profiler
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or b"profile=1" not in scope["query_string"].split(b"&"):
+            await self.app(scope, receive, send)
+            return
+
+        async def discard(message):
+            pass
+
+        profiler = self._profiler_class(interval=self.interval, async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, discard)
+        finally:
+            profiler.stop()
+
+        response = HTMLResponse(profiler.output_html())
+        await response(scope, receive, send)
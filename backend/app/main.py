@@ -1,14 +1,17 @@
-from fastapi import FastAPI, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse, ORJSONResponse
+import asyncio
 import time
 from contextlib import asynccontextmanager
 
+import orjson
+
 from app.core.config import settings
 from app.api.api_v1.api import api_router
-from app.core.logging import setup_logging, get_logger, PerformanceLogger
+from app.core.middleware import EdgeMiddleware, ProfilerMiddleware, set_performance_logger
+from app.core.logging import setup_logging, shutdown_logging, get_logger, PerformanceLogger
 from app.services.cache_service import CacheService
+from app.services.translation_service import shutdown_translation_service, warmup_translation_service
 
 # Global cache service instance
 cache_service = None
@@ -27,11 +30,18 @@ async def lifespan(app: FastAPI):
     # Initialize cache service
     cache_service = CacheService(max_size=1000, ttl_seconds=3600)
     app.state.cache_service = cache_service
+    app.state.cache_expiry_task = asyncio.create_task(cache_service.run_expiry())
     logger.info("Cache service initialized")
     
     # Initialize performance logger
     performance_logger = PerformanceLogger()
     app.state.performance_logger = performance_logger
+    set_performance_logger(performance_logger)
+    
+    # Load ML models concurrently so the first requests do not pay for it
+    if settings.WARMUP_MODELS:
+        await warmup_translation_service()
+        logger.info("Translation models warmed up")
     
     logger.info("Application startup complete")
     
@@ -39,9 +49,13 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down NLP Translation API")
+    await shutdown_translation_service()
+    app.state.cache_expiry_task.cancel()
+    await asyncio.gather(app.state.cache_expiry_task, return_exceptions=True)
     if cache_service:
         await cache_service.clear()
     logger.info("Application shutdown complete")
+    shutdown_logging()
 
 
 # Initialize logging
@@ -58,47 +72,22 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
-# Set up CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# On-demand request profiling for development
+if settings.ENABLE_PROFILING:
+    app.add_middleware(ProfilerMiddleware)
 
-# Add trusted host middleware for security
+# Host validation, CORS and performance monitoring in one middleware layer
 app.add_middleware(
-    TrustedHostMiddleware,
-    allowed_hosts=["localhost", "127.0.0.1", "*.localhost"]
+    EdgeMiddleware,
+    allowed_hosts=["localhost", "127.0.0.1", "*.localhost"],
+    allow_origins=settings.CORS_ORIGINS
 )
 
 
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    """Add performance monitoring middleware."""
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    
-    # Add performance header
-    response.headers["X-Process-Time"] = str(process_time)
-    
-    # Log performance metrics
-    if hasattr(app.state, 'performance_logger'):
-        app.state.performance_logger.log_api_request(
-            endpoint=str(request.url.path),
-            method=request.method,
-            response_time=process_time,
-            status_code=response.status_code
-        )
-    
-    return response
-
-
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler."""
@@ -125,19 +114,34 @@ async def global_exception_handler(request: Request, exc: Exception):
 # Include API routes
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+# Static response bodies, encoded once. /health only splices the timestamp
+# and cache section into its pre-encoded parts.
+_ROOT_JSON = orjson.dumps({
+    "message": "NLP Translation API",
+    "version": settings.VERSION,
+    "status": "healthy",
+    "documentation": {
+        "swagger": "/docs",
+        "redoc": "/redoc",
+        "openapi": f"{settings.API_V1_STR}/openapi.json"
+    }
+})
+_HEALTH_HEAD = b'{"status":"healthy","timestamp":'
+_HEALTH_MIDDLE = (
+    b"," + orjson.dumps({"service": "nlp-translation-api", "version": settings.VERSION})[1:-1]
+    + b',"services":{"cache":'
+)
+_HEALTH_TAIL = (
+    b',"translation":'
+    + orjson.dumps({"status": "healthy", "available_models": ["mock_translator"]})
+    + b"}}"
+)
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
-    return {
-        "message": "NLP Translation API",
-        "version": settings.VERSION,
-        "status": "healthy",
-        "documentation": {
-            "swagger": "/docs",
-            "redoc": "/redoc",
-            "openapi": f"{settings.API_V1_STR}/openapi.json"
-        }
-    }
+    return Response(content=_ROOT_JSON, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
@@ -151,24 +155,26 @@ async def health_check():
         if hasattr(app.state, 'cache_service'):
             cache_stats = await app.state.cache_service.get_stats()
     except Exception as e:
-        logger.warning(f"Cache health check failed: {e}")
+        logger.warning("Cache health check failed: %s", e)
         cache_status = "degraded"
     
-    health_status = {
-        "status": "healthy",
-        "timestamp": time.time(),
-        "service": "nlp-translation-api",
-        "version": settings.VERSION,
-        "services": {
-            "cache": {
-                "status": cache_status,
-                "stats": cache_stats
-            },
-            "translation": {
-                "status": "healthy",
-                "available_models": ["mock_translator"]
-            }
-        }
-    }
+    content = (
+        _HEALTH_HEAD
+        + orjson.dumps(time.time())
+        + _HEALTH_MIDDLE
+        + orjson.dumps({"status": cache_status, "stats": cache_stats})
+        + _HEALTH_TAIL
+    )
+    return Response(content=content, media_type="application/json")
+
+
+if __name__ == "__main__":
+    import uvicorn
     
-    return health_status
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop" if settings.UVLOOP else "asyncio",
+        http="httptools"
+    )
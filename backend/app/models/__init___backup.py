@@ -1,51 +0,0 @@
-# Export all models for easy importing
-from .language import (
-    Language,
-    LanguagePair,
-    SupportedLanguage,
-    ScriptType,
-    TextDirection,
-    LANGUAGE_CONFIGS,
-    get_supported_languages,
-    get_language_by_code,
-    is_language_pair_supported
-)
-
-from .translation import (
-    TranslationRequest,
-    TranslationResponse,
-    BatchTranslationRequest,
-    BatchTranslationResponse,
-    ModelInfo,
-    TranslationStats,
-    ErrorResponse,
-    ValidationResult,
-    TranslationMetrics,
-    ModelType
-)
-    TranslationMetrics,
-    ModelType
-)
-
-__all__ = [
-    # Language models
-    "Language",
-    "LanguagePair", 
-    "SupportedLanguage",
-    "ScriptType",
-    "TextDirection",
-    "LANGUAGE_CONFIGS",
-    "get_supported_languages",
-    "get_language_by_code",
-    "is_language_pair_supported",
-    
-    # Translation models
-    "TranslationRequest",
-    "TranslationResult",
-    "TranslationResponse", 
-    "ErrorResponse",
-    "TranslationHistoryItem",
-    "ValidationResult",
-    "TranslationMetrics",
-    "ModelType"
-]
@@ -1,6 +1,6 @@
 from enum import Enum
-from typing import List, Optional
-from pydantic import BaseModel, Field, validator
+from typing import Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 class SupportedLanguage(str, Enum):
     """Enumeration of supported language codes"""
@@ -32,8 +32,7 @@ class Language(BaseModel):
     direction: TextDirection = TextDirection.LTR
     script_type: ScriptType
     
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True, frozen=True)
 
 # Predefined language configurations
 LANGUAGE_CONFIGS = {
@@ -81,37 +80,34 @@ LANGUAGE_CONFIGS = {
     )
 }
 
+# Lookup structures built once so validation on the request path needs no
+# enum coercion or exception handling
+_VALID_CODES = frozenset(lang.value for lang in SupportedLanguage)
+_LANGUAGES_TUPLE = tuple(LANGUAGE_CONFIGS.values())
+_CODE_TO_LANG = {lang.value: LANGUAGE_CONFIGS[lang] for lang in SupportedLanguage}
+
 class LanguagePair(BaseModel):
     """Language pair model for translation"""
     source: SupportedLanguage
     target: SupportedLanguage
     
-    @validator('target')
-    def validate_different_languages(cls, v, values):
-        if 'source' in values and v == values['source']:
+    @field_validator('target')
+    @classmethod
+    def validate_different_languages(cls, v, info):
+        if 'source' in info.data and v == info.data['source']:
             raise ValueError('Source and target languages must be different')
         return v
     
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
-def get_supported_languages() -> List[Language]:
-    """Get list of all supported languages"""
-    return list(LANGUAGE_CONFIGS.values())
+def get_supported_languages() -> Tuple[Language, ...]:
+    """Get all supported languages (a shared tuple, built once)"""
+    return _LANGUAGES_TUPLE
 
 def get_language_by_code(code: str) -> Optional[Language]:
     """Get language configuration by code"""
-    try:
-        lang_code = SupportedLanguage(code)
-        return LANGUAGE_CONFIGS.get(lang_code)
-    except ValueError:
-        return None
+    return _CODE_TO_LANG.get(code)
 
 def is_language_pair_supported(source: str, target: str) -> bool:
     """Check if a language pair is supported"""
-    try:
-        source_lang = SupportedLanguage(source)
-        target_lang = SupportedLanguage(target)
-        return source_lang != target_lang
-    except ValueError:
-        return False
+    return source in _VALID_CODES and target in _VALID_CODES and source != target
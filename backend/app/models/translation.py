@@ -1,7 +1,7 @@
 from datetime import datetime
 from enum import Enum
 from typing import List, Optional
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from .language import SupportedLanguage
 
 class ModelType(str, Enum):
@@ -18,7 +18,8 @@ class TranslationRequest(BaseModel):
     enable_cache: bool = Field(default=True, description="Whether to use cached results")
     model: Optional[str] = Field(default=None, description="Preferred translation model")
     
-    @validator('text')
+    @field_validator('text')
+    @classmethod
     def validate_text_content(cls, v):
         """Validate text content"""
         v = v.strip()
@@ -26,16 +27,17 @@ class TranslationRequest(BaseModel):
             raise ValueError('Text cannot be empty or whitespace only')
         return v
     
-    @validator('target_language')
-    def validate_different_languages(cls, v, values):
+    @field_validator('target_language')
+    @classmethod
+    def validate_different_languages(cls, v, info):
         """Ensure source and target languages are different"""
-        if 'source_language' in values and v == values['source_language']:
+        if 'source_language' in info.data and v == info.data['source_language']:
             raise ValueError('Source and target languages must be different')
         return v
     
-    class Config:
-        use_enum_values = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        use_enum_values=True,
+        json_schema_extra={
             "example": {
                 "text": "Hello, how are you?",
                 "source_language": "en",
@@ -44,6 +46,7 @@ class TranslationRequest(BaseModel):
                 "model": "auto"
             }
         }
+    )
 
 class TranslationResponse(BaseModel):
     """Response model for translation"""
@@ -56,9 +59,9 @@ class TranslationResponse(BaseModel):
     cached: bool = Field(..., description="Whether result was retrieved from cache")
     detected_language: Optional[str] = Field(None, description="Auto-detected source language")
     
-    class Config:
-        use_enum_values = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        use_enum_values=True,
+        json_schema_extra={
             "example": {
                 "translated_text": "नमस्ते, आप कैसे हैं?",
                 "source_language": "en",
@@ -69,14 +72,16 @@ class TranslationResponse(BaseModel):
                 "cached": False,
                 "detected_language": "en"
             }
-        }
+        },
+        frozen=True
+    )
 
 class BatchTranslationRequest(BaseModel):
     """Request model for batch translation"""
-    requests: List[TranslationRequest] = Field(..., min_items=1, max_items=100, description="List of translation requests")
+    requests: List[TranslationRequest] = Field(..., min_length=1, max_length=100, description="List of translation requests")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "requests": [
                     {
@@ -92,6 +97,7 @@ class BatchTranslationRequest(BaseModel):
                 ]
             }
         }
+    )
 
 class BatchTranslationResponse(BaseModel):
     """Response model for batch translation"""
@@ -100,8 +106,8 @@ class BatchTranslationResponse(BaseModel):
     error_count: int = Field(..., description="Number of failed translations")
     total_processing_time: float = Field(..., description="Total processing time in seconds")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "responses": [
                     {
@@ -118,7 +124,9 @@ class BatchTranslationResponse(BaseModel):
                 "error_count": 0,
                 "total_processing_time": 0.1
             }
-        }
+        },
+        frozen=True
+    )
 
 class ModelInfo(BaseModel):
     """Information about a translation model"""
@@ -128,10 +136,7 @@ class ModelInfo(BaseModel):
     description: str = Field(..., description="Model description")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Information timestamp")
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(frozen=True)
 
 class TranslationStats(BaseModel):
     """Translation service statistics"""
@@ -141,10 +146,7 @@ class TranslationStats(BaseModel):
     supported_language_pairs: int = Field(..., description="Number of supported language pairs")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Statistics timestamp")
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(frozen=True)
 
 class ErrorResponse(BaseModel):
     """Error response model"""
@@ -153,18 +155,17 @@ class ErrorResponse(BaseModel):
     code: Optional[str] = Field(None, description="Error code")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Error timestamp")
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "error": "Unsupported language pair",
                 "details": "Translation from 'xyz' to 'abc' is not supported",
                 "code": "UNSUPPORTED_LANGUAGE_PAIR",
                 "timestamp": "2025-08-09T10:30:00Z"
             }
-        }
+        },
+        frozen=True
+    )
 
 class ValidationResult(BaseModel):
     """Model for validation results"""
@@ -178,8 +179,8 @@ class TranslationMetrics(BaseModel):
     cache_hit_rate: float = Field(..., ge=0.0, le=1.0, description="Cache hit rate percentage")
     popular_language_pairs: List[dict] = Field(default_factory=list, description="Popular language pairs with counts")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "total_translations": 1500,
                 "average_processing_time": 0.325,
@@ -189,4 +190,6 @@ class TranslationMetrics(BaseModel):
                     {"source": "hi", "target": "en", "count": 380}
                 ]
             }
-        }
+        },
+        frozen=True
+    )
@@ -1,15 +1,124 @@
 """
 Cache service for storing translation results.
 """
-import json
-import hashlib
 import asyncio
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+import hashlib
+import random
+import sys
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
 import logging
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# How long get_stats() results are reused, so bursts of health probes
+# share one computation
+_STATS_TTL_SECONDS = 1.0
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a cache value for Redis (numpy scalars from ML models included)."""
+    return orjson.dumps(
+        value,
+        default=str,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+    )
+
+
+def _entry_size(key: str, value: Any) -> int:
+    """Approximate bytes held by a cache entry (key, value and one level of contents)."""
+    size = sys.getsizeof(key) + sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items())
+    return size
+
+
+# Odd 64-bit multipliers deriving one counter index per sketch row
+_SKETCH_SEEDS = (
+    0x9E3779B97F4A7C15,
+    0xC2B2AE3D27D4EB4F,
+    0x165667B19E3779F9,
+    0xD6E8FEB86659FD93,
+)
+_SKETCH_MAX_COUNT = 15
+_HALVE_TABLE = bytes(count >> 1 for count in range(256))
+
+
+class _FrequencySketch:
+    """
+    Count-min sketch of approximate key access frequencies (TinyLFU).
+    
+    Counters saturate at 15, like 4-bit counters, and every counter is
+    halved after a sample period of increments so that old popularity
+    fades. Memory stays at roughly ten counters per cache slot.
+    """
+    
+    def __init__(self, capacity: int):
+        width = 16
+        while width * len(_SKETCH_SEEDS) < capacity * 10:
+            width *= 2
+        self._width = width
+        self._mask = width - 1
+        self._table = bytearray(width * len(_SKETCH_SEEDS))
+        self._sample_period = capacity * 10
+        self._additions = 0
+    
+    def _indexes(self, key: str) -> List[int]:
+        h = hash(key) & 0xFFFFFFFFFFFFFFFF
+        return [
+            row * self._width + (((h * seed) & 0xFFFFFFFFFFFFFFFF) >> 32 & self._mask)
+            for row, seed in enumerate(_SKETCH_SEEDS)
+        ]
+    
+    def increment(self, key: str) -> None:
+        """Record one access to key."""
+        table = self._table
+        for index in self._indexes(key):
+            if table[index] < _SKETCH_MAX_COUNT:
+                table[index] += 1
+        
+        self._additions += 1
+        if self._additions >= self._sample_period:
+            self._table = self._table.translate(_HALVE_TABLE)
+            self._additions //= 2
+    
+    def estimate(self, key: str) -> int:
+        """Get the approximate access count of key."""
+        table = self._table
+        return min(table[index] for index in self._indexes(key))
+
+
+@lru_cache(maxsize=4096)
+def _translation_cache_key(
+    prefix: str,
+    text: str,
+    source_lang: str,
+    target_lang: str,
+    model: str
+) -> str:
+    """
+    Hash translation request parameters into a cache key.
+    
+    Repeated inputs are common in translation UIs, so recent keys are
+    memoized. BLAKE2b is used since the key needs no cryptographic
+    strength and it is faster than MD5 on 64-bit CPUs. Fields are fed to
+    the hasher one at a time instead of being joined into a new string.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(prefix.encode('utf-8'))
+    hasher.update(text.encode('utf-8'))
+    hasher.update(b"|")
+    hasher.update(source_lang.encode('utf-8'))
+    hasher.update(b"|")
+    hasher.update(target_lang.encode('utf-8'))
+    hasher.update(b"|")
+    hasher.update(model.encode('utf-8'))
+    return hasher.hexdigest()
+
 
 class CacheService:
     """In-memory cache service for translation results."""
@@ -24,17 +133,25 @@ class CacheService:
         """
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
-        self.cache: Dict[str, Dict[str, Any]] = {}
+        # Maps key -> (value, monotonic expiry). Insertion order doubles as
+        # recency order: hits move to the end and the least recently used
+        # item is popped from the front. Expired items are dropped lazily.
+        self.cache: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        # Access frequencies used to decide whether a new item is worth
+        # evicting the LRU item for, so one-off requests cannot flush
+        # frequently requested translations
+        self._sketch = _FrequencySketch(max_size)
         self.stats = {
             "hits": 0,
             "misses": 0,
             "size": 0,
-            "evictions": 0
+            "evictions": 0,
+            "rejections": 0
         }
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_cached_at = 0.0
         
-        # Start cleanup task
-        asyncio.create_task(self._cleanup_expired_items())
-        logger.info(f"Cache service initialized with max_size={max_size}, ttl={ttl_seconds}s")
+        logger.info("Cache service initialized with max_size=%s, ttl=%ss", max_size, ttl_seconds)
     
     def generate_cache_key(
         self,
@@ -44,46 +161,129 @@ class CacheService:
         model: str
     ) -> str:
         """Generate a unique cache key for translation request."""
-        # Create a deterministic key from request parameters
-        key_data = f"{text}|{source_lang}|{target_lang}|{model}"
-        return hashlib.md5(key_data.encode('utf-8')).hexdigest()
+        return _translation_cache_key("", text, source_lang, target_lang, model)
     
     async def get(self, key: str) -> Optional[Any]:
         """Get cached item by key."""
-        if key not in self.cache:
+        return self._lookup(key, time.monotonic())
+    
+    async def set(self, key: str, value: Any) -> None:
+        """Set cached item."""
+        now = time.monotonic()
+        self._expire_cold(now)
+        if self._store(key, (value, now + self.ttl_seconds)):
+            self._evict_overflow()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Cached item with key: %s", key)
+    
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get several cached items, in the same order as keys."""
+        now = time.monotonic()
+        return [self._lookup(key, now) for key in keys]
+    
+    async def mset(self, items: Dict[str, Any]) -> None:
+        """Set several cached items."""
+        now = time.monotonic()
+        expires_at = now + self.ttl_seconds
+        self._expire_cold(now)
+        for key, value in items.items():
+            self._store(key, (value, expires_at))
+        self._evict_overflow()
+        logger.debug("Cached %s items", len(items))
+    
+    async def run_expiry(self, interval: float = 1.0, sample_size: int = 20) -> None:
+        """
+        Expire items incrementally until cancelled.
+        
+        Each tick checks a random sample of keys, like Redis' active expiry,
+        so the work per tick stays bounded regardless of cache size. This
+        catches expired items that get() and set() do not reach lazily.
+        
+        Args:
+            interval: Seconds between ticks
+            sample_size: Maximum number of keys checked per tick
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not self.cache:
+                    continue
+                
+                now = time.monotonic()
+                sample = random.sample(list(self.cache), min(sample_size, len(self.cache)))
+                expired = [key for key in sample if self.cache[key][1] < now]
+                for key in expired:
+                    del self.cache[key]
+                
+                if expired:
+                    self.stats["size"] = len(self.cache)
+                    logger.debug("Expired %s cache items", len(expired))
+                    
+            except Exception as e:
+                logger.error("Error during cache expiry: %s", e)
+    
+    def _lookup(self, key: str, now: float) -> Optional[Any]:
+        """Get a live item and mark it most recently used."""
+        self._sketch.increment(key)
+        item = self.cache.get(key)
+        if item is None:
             self.stats["misses"] += 1
             return None
         
-        item = self.cache[key]
+        value, expires_at = item
         
         # Check if item has expired
-        if self._is_expired(item):
+        if now > expires_at:
             del self.cache[key]
             self.stats["size"] = len(self.cache)
             self.stats["misses"] += 1
             return None
         
-        # Update access time
-        item["last_accessed"] = datetime.utcnow()
+        # Mark as most recently used
+        self.cache.move_to_end(key)
         self.stats["hits"] += 1
         
-        return item["value"]
+        return value
     
-    async def set(self, key: str, value: Any) -> None:
-        """Set cached item."""
-        # If cache is full, evict least recently used item
-        if len(self.cache) >= self.max_size and key not in self.cache:
-            await self._evict_lru()
+    def _store(self, key: str, item: Tuple[Any, float]) -> bool:
+        """
+        Insert or refresh an item, subject to TinyLFU admission.
         
-        self.cache[key] = {
-            "value": value,
-            "created_at": datetime.utcnow(),
-            "last_accessed": datetime.utcnow(),
-            "expires_at": datetime.utcnow() + timedelta(seconds=self.ttl_seconds)
-        }
+        A new key arriving at a full cache is only admitted if it has been
+        requested more often than the LRU item it would displace.
+        
+        Returns:
+            True if the item was stored
+        """
+        if key not in self.cache and len(self.cache) >= self.max_size:
+            victim = next(iter(self.cache))
+            if self._sketch.estimate(key) <= self._sketch.estimate(victim):
+                self.stats["rejections"] += 1
+                return False
+        
+        self.cache[key] = item
+        self.cache.move_to_end(key)
+        return True
+    
+    def _expire_cold(self, now: float) -> None:
+        """Drop expired items from the cold end, stopping at the first live one."""
+        # Replaces a periodic full-cache sweep
+        while self.cache:
+            oldest_key, (_, expires_at) = next(iter(self.cache.items()))
+            if expires_at >= now:
+                break
+            del self.cache[oldest_key]
+        self.stats["size"] = len(self.cache)
+    
+    def _evict_overflow(self) -> None:
+        """Evict least recently used items while over capacity."""
+        while len(self.cache) > self.max_size:
+            lru_key, _ = self.cache.popitem(last=False)
+            self.stats["evictions"] += 1
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Evicted LRU item: %s", lru_key)
         
         self.stats["size"] = len(self.cache)
-        logger.debug(f"Cached item with key: {key}")
     
     async def delete(self, key: str) -> bool:
         """Delete cached item by key."""
@@ -100,11 +300,15 @@ class CacheService:
         logger.info("Cache cleared")
     
     async def get_stats(self) -> Dict[str, Any]:
-        """Get cache statistics."""
+        """Get cache statistics (reused for up to a second)."""
+        now = time.monotonic()
+        if self._stats_cache is not None and now - self._stats_cached_at < _STATS_TTL_SECONDS:
+            return self._stats_cache
+        
         total_requests = self.stats["hits"] + self.stats["misses"]
         hit_rate = (self.stats["hits"] / total_requests) if total_requests > 0 else 0
         
-        return {
+        self._stats_cache = {
             "enabled": True,
             "size": self.stats["size"],
             "max_size": self.max_size,
@@ -112,61 +316,21 @@ class CacheService:
             "misses": self.stats["misses"],
             "hit_rate": hit_rate,
             "evictions": self.stats["evictions"],
+            "rejections": self.stats["rejections"],
             "ttl_seconds": self.ttl_seconds,
             "memory_usage_estimate_mb": self._estimate_memory_usage()
         }
+        self._stats_cached_at = now
+        return self._stats_cache
     
-    def _is_expired(self, item: Dict[str, Any]) -> bool:
-        """Check if cached item has expired."""
-        return datetime.utcnow() > item["expires_at"]
-    
-    async def _evict_lru(self) -> None:
-        """Evict least recently used item."""
-        if not self.cache:
-            return
-        
-        # Find the least recently used item
-        lru_key = min(
-            self.cache.keys(),
-            key=lambda k: self.cache[k]["last_accessed"]
-        )
-        
-        del self.cache[lru_key]
-        self.stats["evictions"] += 1
-        self.stats["size"] = len(self.cache)
-        
-        logger.debug(f"Evicted LRU item: {lru_key}")
-    
-    async def _cleanup_expired_items(self) -> None:
-        """Periodically clean up expired items."""
-        while True:
-            try:
-                await asyncio.sleep(300)  # Run every 5 minutes
-                
-                expired_keys = []
-                now = datetime.utcnow()
-                
-                for key, item in self.cache.items():
-                    if now > item["expires_at"]:
-                        expired_keys.append(key)
-                
-                for key in expired_keys:
-                    del self.cache[key]
-                
-                if expired_keys:
-                    self.stats["size"] = len(self.cache)
-                    logger.info(f"Cleaned up {len(expired_keys)} expired cache items")
-                    
-            except Exception as e:
-                logger.error(f"Error during cache cleanup: {e}")
-    
-    def _estimate_memory_usage(self) -> float:
-        """Estimate memory usage in MB (rough approximation)."""
+    def _estimate_memory_usage(self, sample_size: int = 32) -> float:
+        """Estimate memory usage in MB from a random sample of entries."""
         if not self.cache:
             return 0.0
         
-        # Very rough estimation: assume average 1KB per cache entry
-        estimated_bytes = len(self.cache) * 1024
+        sample = random.sample(list(self.cache.items()), min(sample_size, len(self.cache)))
+        sampled_bytes = sum(_entry_size(key, value) for key, (value, _) in sample)
+        estimated_bytes = sampled_bytes / len(sample) * len(self.cache)
         return estimated_bytes / (1024 * 1024)
 
 
@@ -174,37 +338,50 @@ class CacheService:
 class RedisCacheService:
     """Redis-based cache service for production environments."""
     
-    def __init__(self, redis_url: str = "redis://localhost:6379", ttl_seconds: int = 3600):
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379",
+        ttl_seconds: int = 3600,
+        max_connections: int = 50
+    ):
         """
         Initialize Redis cache service.
         
         Args:
             redis_url: Redis connection URL
             ttl_seconds: Time to live for cached items
+            max_connections: Size of the Redis connection pool
         """
         self.redis_url = redis_url
         self.ttl_seconds = ttl_seconds
+        self.max_connections = max_connections
         self.redis_client = None
         self.stats = {
             "hits": 0,
             "misses": 0
         }
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_cached_at = 0.0
         
-        logger.info(f"Redis cache service initialized with URL: {redis_url}")
+        logger.info("Redis cache service initialized with URL: %s", redis_url)
     
     async def _get_redis(self):
         """Get Redis client (lazy initialization)."""
         if self.redis_client is None:
             try:
                 import redis.asyncio as redis
-                self.redis_client = redis.from_url(self.redis_url)
+                pool = redis.ConnectionPool.from_url(
+                    self.redis_url,
+                    max_connections=self.max_connections
+                )
+                self.redis_client = redis.Redis(connection_pool=pool)
                 await self.redis_client.ping()
                 logger.info("Redis connection established")
             except ImportError:
                 logger.error("Redis package not installed. Install with: pip install redis")
                 raise
             except Exception as e:
-                logger.error(f"Failed to connect to Redis: {e}")
+                logger.error("Failed to connect to Redis: %s", e)
                 raise
         
         return self.redis_client
@@ -217,8 +394,7 @@ class RedisCacheService:
         model: str
     ) -> str:
         """Generate a unique cache key for translation request."""
-        key_data = f"translation:{text}|{source_lang}|{target_lang}|{model}"
-        return hashlib.md5(key_data.encode('utf-8')).hexdigest()
+        return _translation_cache_key("translation:", text, source_lang, target_lang, model)
     
     async def get(self, key: str) -> Optional[Any]:
         """Get cached item by key."""
@@ -231,10 +407,10 @@ class RedisCacheService:
                 return None
             
             self.stats["hits"] += 1
-            return json.loads(cached_data)
+            return orjson.loads(cached_data)
             
         except Exception as e:
-            logger.error(f"Redis get error: {e}")
+            logger.error("Redis get error: %s", e)
             self.stats["misses"] += 1
             return None
     
@@ -242,12 +418,48 @@ class RedisCacheService:
         """Set cached item with TTL."""
         try:
             redis_client = await self._get_redis()
-            serialized_value = json.dumps(value, default=str)
+            serialized_value = _dumps(value)
             await redis_client.setex(key, self.ttl_seconds, serialized_value)
-            logger.debug(f"Cached item in Redis with key: {key}")
+            logger.debug("Cached item in Redis with key: %s", key)
+            
+        except Exception as e:
+            logger.error("Redis set error: %s", e)
+    
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get several cached items in one round-trip, in the same order as keys."""
+        if not keys:
+            return []
+        
+        try:
+            redis_client = await self._get_redis()
+            cached_data = await redis_client.mget(keys)
+            
+            values = [orjson.loads(data) if data is not None else None for data in cached_data]
+            hits = len(values) - values.count(None)
+            self.stats["hits"] += hits
+            self.stats["misses"] += len(values) - hits
+            return values
             
         except Exception as e:
-            logger.error(f"Redis set error: {e}")
+            logger.error("Redis mget error: %s", e)
+            self.stats["misses"] += len(keys)
+            return [None] * len(keys)
+    
+    async def mset(self, items: Dict[str, Any]) -> None:
+        """Set several cached items with TTL in one pipelined round-trip."""
+        if not items:
+            return
+        
+        try:
+            redis_client = await self._get_redis()
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.setex(key, self.ttl_seconds, _dumps(value))
+                await pipe.execute()
+            logger.debug("Cached %s items in Redis", len(items))
+            
+        except Exception as e:
+            logger.error("Redis mset error: %s", e)
     
     async def delete(self, key: str) -> bool:
         """Delete cached item by key."""
@@ -257,7 +469,7 @@ class RedisCacheService:
             return result > 0
             
         except Exception as e:
-            logger.error(f"Redis delete error: {e}")
+            logger.error("Redis delete error: %s", e)
             return False
     
     async def clear(self) -> None:
@@ -268,10 +480,14 @@ class RedisCacheService:
             logger.warning("Redis cache cleared")
             
         except Exception as e:
-            logger.error(f"Redis clear error: {e}")
+            logger.error("Redis clear error: %s", e)
     
     async def get_stats(self) -> Dict[str, Any]:
-        """Get cache statistics."""
+        """Get cache statistics (successful results reused for up to a second)."""
+        now = time.monotonic()
+        if self._stats_cache is not None and now - self._stats_cached_at < _STATS_TTL_SECONDS:
+            return self._stats_cache
+        
         try:
             redis_client = await self._get_redis()
             info = await redis_client.info()
@@ -279,7 +495,7 @@ class RedisCacheService:
             total_requests = self.stats["hits"] + self.stats["misses"]
             hit_rate = (self.stats["hits"] / total_requests) if total_requests > 0 else 0
             
-            return {
+            self._stats_cache = {
                 "enabled": True,
                 "type": "redis",
                 "hits": self.stats["hits"],
@@ -292,9 +508,11 @@ class RedisCacheService:
                     "total_commands_processed": info.get("total_commands_processed", 0)
                 }
             }
+            self._stats_cached_at = now
+            return self._stats_cache
             
         except Exception as e:
-            logger.error(f"Redis stats error: {e}")
+            logger.error("Redis stats error: %s", e)
             return {
                 "enabled": False,
                 "error": str(e)
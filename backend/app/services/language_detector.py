@@ -0,0 +1,96 @@
+"""
+Script-based language detection for supported languages.
+"""
+import re
+from typing import List, Dict, Any
+
+# Language buckets tallied by the detector
+_LANGUAGES = ("en", "hi", "bn", "ta", "te")
+
+# Unicode ranges mapped to an index into _LANGUAGES (offset by one)
+_SCRIPT_RANGES = (
+    (0x0041, 0x005A, 1),  # Latin uppercase -> en
+    (0x0061, 0x007A, 1),  # Latin lowercase -> en
+    (0x0900, 0x097F, 2),  # Devanagari -> hi (mr resolved by marker words)
+    (0x0980, 0x09FF, 3),  # Bengali -> bn
+    (0x0B80, 0x0BFF, 4),  # Tamil -> ta
+    (0x0C00, 0x0C7F, 5),  # Telugu -> te
+)
+
+
+def _build_script_matchers():
+    """
+    Build the C-level scanners used to tally characters per script.
+
+    Returns a compiled pattern matching runs of characters outside every
+    supported script, and a str.translate table mapping each supported code
+    point to its bucket marker (the bucket number as a character).
+    """
+    classes = "".join(
+        f"{re.escape(chr(start))}-{re.escape(chr(end))}"
+        for start, end, _ in _SCRIPT_RANGES
+    )
+    unsupported = re.compile(f"[^{classes}]+")
+    to_bucket = {
+        code_point: chr(bucket)
+        for start, end, bucket in _SCRIPT_RANGES
+        for code_point in range(start, end + 1)
+    }
+    return unsupported, to_bucket
+
+
+_UNSUPPORTED_RUN, _BUCKET_TABLE = _build_script_matchers()
+_BUCKET_MARKERS = tuple(chr(bucket) for bucket in range(1, len(_LANGUAGES) + 1))
+
+# Frequent function words that tell Marathi apart from Hindi (both Devanagari)
+_MARATHI_MARKERS = frozenset({
+    "आहे", "आहेत", "नाही", "आणि", "मी", "तुम्ही", "काय", "कसे", "होय", "आम्ही"
+})
+_HINDI_MARKERS = frozenset({
+    "है", "हैं", "नहीं", "और", "मैं", "आप", "क्या", "कैसे", "हाँ", "हम"
+})
+
+
+def _resolve_devanagari(text: str) -> str:
+    """Pick between Hindi and Marathi for Devanagari text."""
+    marathi_hits = 0
+    hindi_hits = 0
+    for word in text.split():
+        if word in _MARATHI_MARKERS:
+            marathi_hits += 1
+        elif word in _HINDI_MARKERS:
+            hindi_hits += 1
+    return "mr" if marathi_hits > hindi_hits else "hi"
+
+
+def detect_language(text: str) -> List[Dict[str, Any]]:
+    """
+    Detect the language of text from the scripts it is written in.
+
+    Args:
+        text: Text to analyze
+
+    Returns:
+        Predictions sorted by descending confidence; empty if the text
+        contains no characters from a supported script
+    """
+    # Both passes run inside the regex engine and str.translate rather than
+    # a Python-level loop over characters
+    buckets = _UNSUPPORTED_RUN.sub("", text).translate(_BUCKET_TABLE)
+    total = len(buckets)
+    if not total:
+        return []
+
+    predictions = []
+    for marker, language in zip(_BUCKET_MARKERS, _LANGUAGES):
+        count = buckets.count(marker)
+        if count:
+            if language == "hi":
+                language = _resolve_devanagari(text)
+            predictions.append({
+                "language": language,
+                "confidence": round(count / total, 4)
+            })
+
+    predictions.sort(key=lambda p: p["confidence"], reverse=True)
+    return predictions
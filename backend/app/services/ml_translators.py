@@ -2,43 +2,108 @@
 Real ML model translator implementations.
 """
 import asyncio
+import os
+import re
+import shutil
+import tempfile
 import time
-from typing import Optional
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import List, Optional, Tuple
 import logging
 
-# Add the ml_models directory to the path
+# Make the top-level ml_models package importable; done once per process
 import sys
-import os
 from pathlib import Path
 
-# Get the project root directory
 project_root = Path(__file__).parent.parent.parent.parent
-ml_models_path = project_root / "ml_models"
-
-# Add both the ml_models path and the project root to Python path
-if str(ml_models_path) not in sys.path:
-    sys.path.insert(0, str(ml_models_path))
 if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+    sys.path.append(str(project_root))
 
 try:
-    from inference.model_loader import ModelLoader
-    from inference.indictrans_model import IndicTransModel
-    from inference.m2m100_model import M2M100Model
-    from inference.mbart_model import MBartModel
+    from ml_models.inference import ModelLoader, IndicTransModel, M2M100Model, MBartModel
     ML_MODELS_AVAILABLE = True
 except ImportError as e:
     logging.warning(f"ML models not available: {e}")
     ML_MODELS_AVAILABLE = False
 
+try:
+    import onnxruntime as ort
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    ONNX_RUNTIME_AVAILABLE = True
+except ImportError:
+    ONNX_RUNTIME_AVAILABLE = False
+
+from app.core.config import settings
 from app.services.translation_service import BaseTranslator, TranslationResult
 
 logger = logging.getLogger(__name__)
 
 
+# Characters that may touch a phrase without being part of it: whitespace and
+# sentence punctuation only, so parts of hyphenated words or contractions are
+# left alone. Listed explicitly because Indic vowel signs are not \w and must
+# not split words.
+_PHRASE_DELIMITERS = r"\s.,!?;:\"()\[\]{}।"
+_PUNCTUATION = re.compile(r'[^\w\s]')
+
+
+def _compile_phrase_pattern(phrases) -> "re.Pattern":
+    """
+    Compile phrases into one alternation matching whole words only.
+    
+    Longer phrases are tried first, so each scan position takes the longest
+    phrase starting there (greedy leftmost-longest).
+    """
+    alternation = "|".join(re.escape(phrase) for phrase in sorted(phrases, key=len, reverse=True))
+    return re.compile(
+        f"(?<![^{_PHRASE_DELIMITERS}])(?:{alternation})(?![^{_PHRASE_DELIMITERS}])"
+    )
+
+
+def _cpu_supports_vnni() -> bool:
+    """
+    Check for AVX-512 VNNI or AVX-VNNI int8 dot-product instructions.
+    
+    Without them INT8 GEMMs are emulated and typically slower than FP32.
+    """
+    try:
+        with open("/proc/cpuinfo") as cpuinfo:
+            flags = cpuinfo.read()
+    except OSError:
+        return False
+    return "avx512_vnni" in flags or "avx_vnni" in flags
+
+
+@contextmanager
+def _staging_dir(target: Path):
+    """
+    Yield an empty directory that is renamed to target once the block completes.
+    
+    Other workers exporting the same model at the same time never see a
+    partial target; if one of them publishes first, its copy is kept.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging_dir = Path(tempfile.mkdtemp(prefix=f".{target.name}-", dir=target.parent))
+    try:
+        yield staging_dir
+        try:
+            os.replace(staging_dir, target)
+        except OSError:
+            # Another worker published first; keep its copy
+            if not target.exists():
+                raise
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
 class MLModelTranslator(BaseTranslator):
     """Base class for ML model-based translators."""
     
+    # Whether the HuggingFace checkpoint ships custom modeling code
+    trust_remote_code = False
+    
     def __init__(self, model_type: str, model_class=None):
         super().__init__()
         self.model_type = model_type
@@ -46,12 +111,23 @@ class MLModelTranslator(BaseTranslator):
         self.model_loader = None
         self.model = None
         self.is_loaded = False
+        self.uses_onnx_runtime = False
+        # Numeric precision of the model ("fp32", "fp16", "bf16" or "int8")
+        self.precision = None
+        # Serializes loading, so concurrent first requests load the model once
+        self._init_lock = asyncio.Lock()
         
     async def initialize(self):
-        """Initialize the ML model."""
+        """Initialize the ML model, unless a concurrent call already did."""
         if not ML_MODELS_AVAILABLE:
             raise RuntimeError("ML models are not available")
-            
+        
+        async with self._init_lock:
+            if not self.is_loaded:
+                await self._initialize()
+    
+    async def _initialize(self):
+        """Load the model and apply the configured runtime optimizations."""
         try:
             self.model_loader = ModelLoader()
             self.model = await self.model_loader.load_model(
@@ -60,6 +136,14 @@ class MLModelTranslator(BaseTranslator):
             )
             
             if self.model:
+                if settings.ONNX_RUNTIME and ONNX_RUNTIME_AVAILABLE:
+                    await self._enable_onnx_runtime()
+                if not self.uses_onnx_runtime:
+                    # Casting weights is blocking GPU work
+                    loop = asyncio.get_running_loop()
+                    await loop.run_in_executor(None, self._apply_model_dtype)
+                if settings.TORCH_COMPILE and not self.uses_onnx_runtime:
+                    self._compile_torch_model()
                 self.is_loaded = True
                 logger.info(f"Initialized {self.model_type} translator")
             else:
@@ -69,6 +153,138 @@ class MLModelTranslator(BaseTranslator):
             logger.error(f"Failed to initialize {self.model_type} translator: {e}")
             raise
     
+    async def _enable_onnx_runtime(self):
+        """
+        Run the model's generation through an ONNX Runtime session.
+        
+        ORTModelForSeq2SeqLM exposes the same generate() API as the PyTorch
+        network it replaces, so each model keeps its own tokenization and
+        language-token handling. Falls back to PyTorch if export fails.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            ort_model = await loop.run_in_executor(None, self._load_onnx_model)
+        except Exception as e:
+            logger.warning(f"ONNX Runtime unavailable for {self.model_type}, using PyTorch: {e}")
+            return
+        
+        # Replace rather than keep the PyTorch weights alongside the session
+        self.model._model = ort_model
+        self.uses_onnx_runtime = True
+        logger.info(f"Using ONNX Runtime for {self.model_type} translator")
+    
+    def _load_onnx_model(self):
+        """Load the exported ONNX model, exporting (and quantizing) it on first use."""
+        # Keyed on the checkpoint too, so changing a model's name or path
+        # never reuses an export of a different network
+        source = self.model.model_path or self.model.model_name
+        checkpoint = re.sub(r"[^\w.-]+", "--", str(source)).strip("-")
+        fp32_dir = Path(settings.MODEL_CACHE_DIR) / "onnx" / f"{self.model_type}-{checkpoint}"
+        
+        session_options = ort.SessionOptions()
+        session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if "CUDAExecutionProvider" in ort.get_available_providers():
+            provider = "CUDAExecutionProvider"
+        else:
+            provider = "CPUExecutionProvider"
+        
+        use_int8 = settings.INT8 and provider == "CPUExecutionProvider"
+        if use_int8 and not _cpu_supports_vnni():
+            logger.warning(f"INT8 requested for {self.model_type} but CPU lacks VNNI, using FP32")
+            use_int8 = False
+        
+        # Exports are cached per model so only the first start pays for them
+        if not fp32_dir.exists():
+            ort_model = ORTModelForSeq2SeqLM.from_pretrained(
+                source,
+                export=True,
+                provider=provider,
+                session_options=session_options,
+                trust_remote_code=self.trust_remote_code
+            )
+            with _staging_dir(fp32_dir) as staging_dir:
+                ort_model.save_pretrained(staging_dir)
+            if not use_int8:
+                self.precision = "fp32"
+                return ort_model
+        
+        model_dir = self._quantize_onnx_model(fp32_dir) if use_int8 else fp32_dir
+        ort_model = ORTModelForSeq2SeqLM.from_pretrained(
+            model_dir,
+            provider=provider,
+            session_options=session_options,
+            trust_remote_code=self.trust_remote_code
+        )
+        self.precision = "int8" if use_int8 else "fp32"
+        return ort_model
+    
+    def _quantize_onnx_model(self, fp32_dir: Path) -> Path:
+        """Quantize the MatMul weights of an export to INT8, cached next to it."""
+        int8_dir = fp32_dir.with_name(f"{fp32_dir.name}-int8")
+        if int8_dir.exists():
+            return int8_dir
+        
+        with _staging_dir(int8_dir) as staging_dir:
+            for path in fp32_dir.iterdir():
+                if path.suffix == ".onnx":
+                    # Signed weights on MatMul only; unsigned per-channel weights
+                    # are known to regress both speed and accuracy
+                    quantize_dynamic(
+                        path,
+                        staging_dir / path.name,
+                        op_types_to_quantize=["MatMul"],
+                        weight_type=QuantType.QInt8
+                    )
+                elif path.is_file() and not path.name.endswith(".onnx_data"):
+                    shutil.copy2(path, staging_dir / path.name)
+        
+        logger.info(f"Quantized {self.model_type} ONNX model to INT8")
+        return int8_dir
+    
+    def _apply_model_dtype(self):
+        """Cast the PyTorch network to the configured dtype on GPU."""
+        import torch
+        
+        if not torch.cuda.is_available():
+            return
+        
+        dtype = settings.MODEL_DTYPE
+        if dtype == "bf16" and not torch.cuda.is_bf16_supported():
+            logger.warning(f"GPU lacks bfloat16 support, using fp16 for {self.model_type}")
+            dtype = "fp16"
+        
+        torch_dtype = {"fp16": torch.float16, "bf16": torch.bfloat16, "fp32": torch.float32}.get(dtype)
+        if torch_dtype is None:
+            logger.warning(f"Unknown MODEL_DTYPE {dtype!r}, keeping {self.model_type} dtype")
+            return
+        
+        # Inputs are integer token IDs, so only the weights need casting
+        self.model._model = self.model._model.to(torch_dtype)
+        self.precision = dtype
+    
+    def _compile_torch_model(self):
+        """
+        Compile the PyTorch network's forward pass with torch.compile.
+        
+        Only forward is compiled, since generate() calls it once per output
+        token. Graphs the compiler cannot handle fall back to eager mode.
+        """
+        import torch
+        
+        if not hasattr(torch, "compile"):
+            logger.warning(f"torch.compile needs PyTorch 2.0+, running {self.model_type} eagerly")
+            return
+        
+        try:
+            import torch._dynamo
+            torch._dynamo.config.suppress_errors = True
+            
+            network = self.model._model
+            network.forward = torch.compile(network.forward, mode="reduce-overhead", fullgraph=False)
+            logger.info(f"Compiled {self.model_type} model with torch.compile")
+        except Exception as e:
+            logger.warning(f"torch.compile failed for {self.model_type}, running eagerly: {e}")
+    
     async def translate(self, text: str, source_lang: str, target_lang: str) -> TranslationResult:
         """Translate using the ML model."""
         if not self.is_loaded:
@@ -99,6 +315,41 @@ class MLModelTranslator(BaseTranslator):
             # Fallback to basic translation on error
             return await self._fallback_translate(text, source_lang, target_lang)
     
+    async def translate_batch(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str
+    ) -> List[TranslationResult]:
+        """Translate several texts with batched, length-bucketed generation."""
+        if not self.is_loaded:
+            await self.initialize()
+            
+        if not self.model:
+            raise RuntimeError(f"{self.model_type} model not loaded")
+            
+        try:
+            results = await self.model.translate_batch(texts, source_lang, target_lang)
+        except Exception as e:
+            logger.error(f"Batch translation error in {self.model_type}: {e}")
+            # Fall back to per-text translation, which has its own fallback
+            return [await self.translate(text, source_lang, target_lang) for text in texts]
+        
+        translations = []
+        for text, result in zip(texts, results):
+            best_prediction = result.best_prediction
+            if not best_prediction:
+                translations.append(await self._fallback_translate(text, source_lang, target_lang))
+                continue
+            translations.append(TranslationResult(
+                translated_text=best_prediction.text,
+                confidence=best_prediction.confidence,
+                model_used=self.model_type,
+                detected_language=None,
+                alternatives=[]
+            ))
+        return translations
+    
     async def _fallback_translate(self, text: str, source_lang: str, target_lang: str) -> TranslationResult:
         """Fallback translation when ML model fails."""
         return TranslationResult(
@@ -110,9 +361,32 @@ class MLModelTranslator(BaseTranslator):
         )
 
 
+async def warmup_all(translators) -> None:
+    """
+    Initialize ML translators concurrently, e.g. at application startup.
+    
+    Cold start then takes as long as the slowest model rather than the sum
+    of all of them, and no request pays for loading. Failures are logged
+    and the affected translator retries lazily on first use.
+    
+    Args:
+        translators: Translators to warm up; non-ML ones are ignored
+    """
+    if not ML_MODELS_AVAILABLE:
+        return
+    
+    pending = [t for t in translators if isinstance(t, MLModelTranslator) and not t.is_loaded]
+    results = await asyncio.gather(*(t.initialize() for t in pending), return_exceptions=True)
+    for translator, result in zip(pending, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Warmup failed for {translator.model_type} translator: {result}")
+
+
 class IndicTransTranslator(MLModelTranslator):
     """IndicTrans translator for Indian languages."""
     
+    trust_remote_code = True
+    
     def __init__(self):
         super().__init__("indictrans", IndicTransModel if ML_MODELS_AVAILABLE else None)
         self.description = "IndicTrans for English-Indian language translation"
@@ -134,6 +408,90 @@ class MBartTranslator(MLModelTranslator):
         self.description = "mBART for multilingual translation"
 
 
+# Basic translation dictionary for common phrases, per (source, target) pair
+_TRANSLATIONS = {
+    ("en", "hi"): {
+        "hello": "नमस्ते",
+        "hello world": "नमस्ते संसार",
+        "hello, how are you?": "नमस्ते, आप कैसे हैं?",
+        "how are you?": "आप कैसे हैं?",
+        "how are you": "आप कैसे हैं",
+        "good morning": "सुप्रभात",
+        "good evening": "शुभ संध्या",
+        "thank you": "धन्यवाद",
+        "what is your name": "आपका नाम क्या है",
+        "nice to meet you": "आपसे मिलकर खुशी हुई",
+        "goodbye": "अलविदा",
+        "yes": "हाँ",
+        "no": "नहीं",
+        "please": "कृपया",
+        "sorry": "माफ़ करें",
+        "welcome": "स्वागत है",
+        "i am fine": "मैं ठीक हूँ",
+        "what are you doing": "आप क्या कर रहे हैं",
+        "where are you going": "आप कहाँ जा रहे हैं"
+    },
+    ("hi", "en"): {
+        "नमस्ते": "hello",
+        "सुप्रभात": "good morning",
+        "धन्यवाद": "thank you",
+        "अलविदा": "goodbye",
+        "हाँ": "yes",
+        "नहीं": "no",
+        "आप कैसे हैं": "how are you",
+        "मैं ठीक हूँ": "i am fine"
+    }
+}
+
+
+# One pass over the text finds every known phrase, in place of a dictionary
+# lookup and regex substitution per word
+_PHRASE_PATTERNS = {
+    lang_pair: _compile_phrase_pattern(phrases)
+    for lang_pair, phrases in _TRANSLATIONS.items()
+}
+
+
+@lru_cache(maxsize=4096)
+def _lightweight_lookup(text: str, source_lang: str, target_lang: str) -> Tuple[str, float]:
+    """
+    Translate text with the phrase tables.
+    
+    The same short phrases recur constantly in chat-style traffic, so
+    results are memoized; they are plain tuples so no mutable result object
+    is shared between callers. The cache is keyed on the raw text, so a
+    repeat request skips normalization as well. Hit rate is available via
+    cache_info().
+    
+    Returns:
+        Translated text and confidence
+    """
+    text_lower = text.lower().strip()
+    table = _TRANSLATIONS.get((source_lang, target_lang))
+    
+    # Unknown pairs pass the text through unchanged
+    if table is None:
+        return " ".join(text_lower.split()), 0.6
+    
+    # Look for exact match first (including punctuation)
+    if text_lower in table:
+        return table[text_lower], 0.9
+    
+    # Try removing punctuation for phrase matching; a plain alphanumeric
+    # word has none to remove and was already checked above
+    if not text_lower.isalnum():
+        text_clean = _PUNCTUATION.sub('', text_lower)
+        if text_clean in table:
+            return table[text_clean], 0.8
+    
+    # Translate known phrases in place as fallback, keeping other words
+    translated_text = _PHRASE_PATTERNS[(source_lang, target_lang)].sub(
+        lambda match: table[match.group()],
+        " ".join(text_lower.split())
+    )
+    return translated_text, 0.6
+
+
 # Lightweight fallback translators that work without heavy ML dependencies
 class LightweightIndicTransTranslator(BaseTranslator):
     """Lightweight IndicTrans translator using a basic approach."""
@@ -141,86 +499,35 @@ class LightweightIndicTransTranslator(BaseTranslator):
     def __init__(self):
         super().__init__()
         self.description = "Lightweight IndicTrans fallback"
-        
-        # Basic translation dictionary for common phrases
-        self.translations = {
-            ("en", "hi"): {
-                "hello": "नमस्ते",
-                "hello world": "नमस्ते संसार",
-                "hello, how are you?": "नमस्ते, आप कैसे हैं?",
-                "how are you?": "आप कैसे हैं?",
-                "how are you": "आप कैसे हैं",
-                "good morning": "सुप्रभात",
-                "good evening": "शुभ संध्या",
-                "thank you": "धन्यवाद",
-                "what is your name": "आपका नाम क्या है",
-                "nice to meet you": "आपसे मिलकर खुशी हुई",
-                "goodbye": "अलविदा",
-                "yes": "हाँ",
-                "no": "नहीं",
-                "please": "कृपया",
-                "sorry": "माफ़ करें",
-                "welcome": "स्वागत है",
-                "i am fine": "मैं ठीक हूँ",
-                "what are you doing": "आप क्या कर रहे हैं",
-                "where are you going": "आप कहाँ जा रहे हैं"
-            },
-            ("hi", "en"): {
-                "नमस्ते": "hello",
-                "सुप्रभात": "good morning",
-                "धन्यवाद": "thank you",
-                "अलविदा": "goodbye",
-                "हाँ": "yes",
-                "नहीं": "no",
-                "आप कैसे हैं": "how are you",
-                "मैं ठीक हूँ": "i am fine"
-            }
-        }
     
     async def translate(self, text: str, source_lang: str, target_lang: str) -> TranslationResult:
         """Translate using basic dictionary lookup."""
-        text_lower = text.lower().strip()
-        lang_pair = (source_lang, target_lang)
-        
-        # Look for exact match first (including punctuation)
-        if lang_pair in self.translations:
-            if text_lower in self.translations[lang_pair]:
-                return TranslationResult(
-                    translated_text=self.translations[lang_pair][text_lower],
-                    confidence=0.9,
-                    model_used="auto",
-                    detected_language=source_lang,
-                    alternatives=[]
-                )
-        
-        # Try removing punctuation for phrase matching
-        import re
-        text_clean = re.sub(r'[^\w\s]', '', text_lower)
-        if lang_pair in self.translations:
-            if text_clean in self.translations[lang_pair]:
-                return TranslationResult(
-                    translated_text=self.translations[lang_pair][text_clean],
-                    confidence=0.8,
-                    model_used="auto",
-                    detected_language=source_lang,
-                    alternatives=[]
-                )
-        
-        # Basic word-by-word translation as fallback
-        words = text_lower.split()
-        translated_words = []
-        
-        for word in words:
-            word_clean = re.sub(r'[^\w]', '', word)
-            if lang_pair in self.translations and word_clean in self.translations[lang_pair]:
-                translated_words.append(self.translations[lang_pair][word_clean])
-            else:
-                translated_words.append(word)  # Keep original if no translation
-        
+        translated_text, confidence = _lightweight_lookup(text, source_lang, target_lang)
         return TranslationResult(
-            translated_text=" ".join(translated_words),
-            confidence=0.6,
+            translated_text=translated_text,
+            confidence=confidence,
             model_used="auto",
             detected_language=source_lang,
             alternatives=[]
         )
+    
+    async def translate_batch(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str
+    ) -> List[TranslationResult]:
+        """Translate several texts in one synchronous pass over the lookup."""
+        # Lookups never block, so there is no point scheduling a coroutine
+        # per text as the default implementation does
+        results = []
+        for text in texts:
+            translated_text, confidence = _lightweight_lookup(text, source_lang, target_lang)
+            results.append(TranslationResult(
+                translated_text=translated_text,
+                confidence=confidence,
+                model_used="auto",
+                detected_language=source_lang,
+                alternatives=[]
+            ))
+        return results
@@ -3,29 +3,29 @@ Translation service for handling multiple translation models.
 """
 import asyncio
 import time
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass
+from collections import Counter, OrderedDict
+from typing import Optional, List, Dict, Any, Tuple
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from types import MappingProxyType
 import logging
 
+from app.core.config import settings
 from app.models.language import get_language_by_code, get_supported_languages
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslationResult:
-    """Translation result from a model."""
+    """Translation result from a model (slotted, as one is built per text)."""
     translated_text: str
     confidence: float
     model_used: str
     detected_language: Optional[str] = None
-    alternatives: List[Dict[str, Any]] = None
-    
-    def __post_init__(self):
-        if self.alternatives is None:
-            self.alternatives = []
+    # Filled in by the generated __init__, without a __post_init__ call
+    alternatives: List[Dict[str, Any]] = field(default_factory=list)
 
 
 class ModelType(Enum):
@@ -37,19 +37,52 @@ class ModelType(Enum):
     MOCK = "mock"  # For development/testing
 
 
+# Languages routed to the Indic-first model priority
+_INDIAN_LANGUAGES = frozenset({"hi", "ta", "te", "bn", "mr"})
+
+# Codes of all supported languages, which every model currently reports
+_SUPPORTED_LANGUAGE_CODES = tuple(lang.code for lang in get_supported_languages())
+
+# Model priority for pairs involving an Indian language
+_INDIAN_MODEL_PRIORITY = (
+    "lightweight_indictrans",    # Lightweight fallback (always works)
+    ModelType.INDICTRANS.value,  # Best for Indian languages (if available)
+    ModelType.M2M100.value,      # Good multilingual model
+    ModelType.MBART.value,       # Alternative multilingual model
+    ModelType.MOCK.value         # Final fallback
+)
+
+# Model priority for other language pairs
+_OTHER_MODEL_PRIORITY = (
+    ModelType.M2M100.value,      # Good for general multilingual
+    ModelType.MBART.value,       # Alternative multilingual
+    "lightweight_indictrans",    # Basic fallback
+    ModelType.INDICTRANS.value,  # May support the pair
+    ModelType.MOCK.value         # Final fallback
+)
+
+
 class TranslationService:
     """Main translation service coordinating multiple models."""
     
     def __init__(self):
         self.models = {}
-        self.stats = {
-            "total_translations": 0,
-            "translations_by_model": {},
-            "translations_by_language": {},
-            "average_processing_time": 0,
-            "total_processing_time": 0
-        }
+        # Statistics, reported through get_stats()
+        self._total_translations = 0
+        self._total_processing_time = 0.0
+        self._translations_by_model: Counter = Counter()
+        self._translations_by_language: Counter = Counter()
+        # Recent results keyed by (model, source, target, text), most recent last
+        self._result_cache: "OrderedDict[Tuple[str, str, str, str], TranslationResult]" = OrderedDict()
+        self.result_cache_size = settings.RESULT_CACHE_SIZE
+        self.result_cache_text_limit = settings.RESULT_CACHE_TEXT_LIMIT
         self._initialize_models()
+        self._indian_choice, self._other_choice = self._resolve_auto_models()
+        self.batch_scheduler = BatchScheduler(
+            self,
+            max_batch_size=settings.BATCH_SIZE,
+            max_delay_ms=settings.BATCH_MAX_DELAY_MS
+        )
     
     def _initialize_models(self):
         """Initialize available translation models."""
@@ -72,24 +105,22 @@ class TranslationService:
             # Initialize lightweight version first as fallback
             self.models["lightweight_indictrans"] = LightweightIndicTransTranslator()
             
-            # Try to initialize heavy ML models
-            try:
-                self.models[ModelType.INDICTRANS.value] = IndicTransTranslator()
-                logger.info("IndicTrans model initialized")
-            except Exception as e:
-                logger.warning(f"IndicTrans model failed to initialize: {e}")
-                
-            try:
-                self.models[ModelType.M2M100.value] = M2M100Translator()
-                logger.info("M2M100 model initialized")
-            except Exception as e:
-                logger.warning(f"M2M100 model failed to initialize: {e}")
-                
-            try:
-                self.models[ModelType.MBART.value] = MBartTranslator()
-                logger.info("mBART model initialized")
-            except Exception as e:
-                logger.warning(f"mBART model failed to initialize: {e}")
+            # Register heavy ML models; construction is cheap and each one
+            # loads its weights on first use (or at startup warmup)
+            heavy_models = (
+                (ModelType.INDICTRANS.value, IndicTransTranslator, "IndicTrans"),
+                (ModelType.M2M100.value, M2M100Translator, "M2M100"),
+                (ModelType.MBART.value, MBartTranslator, "mBART"),
+            )
+            for name, translator_class, label in heavy_models:
+                if name not in settings.ML_MODELS:
+                    logger.info(f"{label} model disabled by ML_MODELS")
+                    continue
+                try:
+                    self.models[name] = translator_class()
+                    logger.info(f"{label} model initialized")
+                except Exception as e:
+                    logger.warning(f"{label} model failed to initialize: {e}")
                 
         except ImportError as e:
             logger.warning(f"ML translators not available: {e}")
@@ -118,7 +149,7 @@ class TranslationService:
         Returns:
             TranslationResult with translated text and metadata
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Validate languages
@@ -135,13 +166,17 @@ class TranslationService:
             if not selected_model:
                 raise ValueError(f"No suitable model found for {source_language}->{target_language}")
             
-            # Perform translation
-            translator = self.models[selected_model]
-            result = await translator.translate(text, source_language, target_language)
-            result.model_used = selected_model
+            # Perform translation unless the same request was answered recently
+            cache_key = (selected_model, source_language, target_language, text)
+            result = self._get_cached_result(cache_key)
+            if result is None:
+                translator = self.models[selected_model]
+                result = await translator.translate(text, source_language, target_language)
+                self._store_result(cache_key, result)
+                result.model_used = selected_model
             
             # Update statistics
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             self._update_stats(source_language, target_language, selected_model, processing_time)
             
             logger.info(
@@ -155,58 +190,145 @@ class TranslationService:
             logger.error(f"Translation error: {e}")
             raise
     
+    async def translate_batch(
+        self,
+        texts: List[str],
+        source_language: str,
+        target_language: str,
+        model: str = "auto"
+    ) -> List[TranslationResult]:
+        """
+        Translate several texts sharing a language pair and model.
+        
+        Args:
+            texts: Texts to translate
+            source_language: Source language code
+            target_language: Target language code
+            model: Model to use ("auto" for automatic selection)
+            
+        Returns:
+            TranslationResults in the same order as texts; duplicate texts
+            share a single result
+        """
+        start_time = time.perf_counter()
+        
+        try:
+            # Validate languages once for the whole batch
+            if not get_language_by_code(source_language):
+                raise ValueError(f"Unsupported source language: {source_language}")
+            if not get_language_by_code(target_language):
+                raise ValueError(f"Unsupported target language: {target_language}")
+            
+            selected_model = self._select_model(model, source_language, target_language)
+            if not selected_model:
+                raise ValueError(f"No suitable model found for {source_language}->{target_language}")
+            
+            translator = self.models[selected_model]
+            
+            # Translate each distinct, not recently seen text once and fan
+            # results back out
+            results_by_text = {}
+            pending_texts = []
+            for text in dict.fromkeys(texts):
+                result = self._get_cached_result((selected_model, source_language, target_language, text))
+                if result is None:
+                    pending_texts.append(text)
+                else:
+                    results_by_text[text] = result
+            
+            if pending_texts:
+                pending_results = await translator.translate_batch(pending_texts, source_language, target_language)
+                for text, result in zip(pending_texts, pending_results):
+                    self._store_result((selected_model, source_language, target_language, text), result)
+                    result.model_used = selected_model
+                    results_by_text[text] = result
+            results = [results_by_text[text] for text in texts]
+            
+            processing_time = time.perf_counter() - start_time
+            if texts:
+                self._update_stats(
+                    source_language, target_language, selected_model, processing_time, count=len(texts)
+                )
+            
+            logger.info(
+                f"Batch translation completed: {len(texts)} texts ({len(results_by_text)} unique, "
+                f"{len(pending_texts)} translated) "
+                f"{source_language}->{target_language} using {selected_model} in {processing_time:.3f}s"
+            )
+            
+            return list(results)
+            
+        except Exception as e:
+            logger.error(f"Batch translation error: {e}")
+            raise
+    
+    def _get_cached_result(self, key: Tuple[str, str, str, str]) -> Optional[TranslationResult]:
+        """Return a copy of a recently stored result, or None."""
+        result = self._result_cache.get(key)
+        if result is None:
+            return None
+        self._result_cache.move_to_end(key)
+        # Copied so callers can modify their result without touching the cache
+        return replace(result, alternatives=list(result.alternatives))
+    
+    def _store_result(self, key: Tuple[str, str, str, str], result: TranslationResult) -> None:
+        """
+        Remember a result, evicting the least recently used beyond the limit.
+        
+        Must be called before model_used is overwritten: translators mark
+        placeholder output from a failed model with a "_fallback" model_used,
+        and that must not be served once the model recovers. The stored copy
+        is attributed to the model in the key.
+        """
+        # Long texts rarely repeat, so they are not worth the memory
+        if self.result_cache_size <= 0 or len(key[3]) > self.result_cache_text_limit:
+            return
+        if result.model_used.endswith("_fallback"):
+            return
+        self._result_cache[key] = replace(result, model_used=key[0], alternatives=list(result.alternatives))
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > self.result_cache_size:
+            self._result_cache.popitem(last=False)
+    
     def _select_model(self, requested_model: str, source_lang: str, target_lang: str) -> Optional[str]:
         """Select the best available model for the language pair."""
         if requested_model != "auto" and requested_model in self.models:
             return requested_model
         
-        # Auto-selection logic based on available models
-        available_models = list(self.models.keys())
-        
-        # Priority order for model selection based on language pair
-        if source_lang in {"hi", "ta", "te", "bn", "mr"} or target_lang in {"hi", "ta", "te", "bn", "mr"}:
-            # For Indian languages, prefer lightweight then heavy models
-            model_priority = [
-                "lightweight_indictrans",    # Lightweight fallback (always works)
-                ModelType.INDICTRANS.value,  # Best for Indian languages (if available)
-                ModelType.M2M100.value,      # Good multilingual model
-                ModelType.MBART.value,       # Alternative multilingual model
-                ModelType.MOCK.value         # Final fallback
-            ]
-        else:
-            # For other language pairs
-            model_priority = [
-                ModelType.M2M100.value,      # Good for general multilingual
-                ModelType.MBART.value,       # Alternative multilingual
-                "lightweight_indictrans",    # Basic fallback
-                ModelType.INDICTRANS.value,  # May support the pair
-                ModelType.MOCK.value         # Final fallback
-            ]
-        
-        for model in model_priority:
-            if model in available_models:
-                return model
-        
-        return None
+        # Auto-selection only depends on whether an Indian language is involved
+        if source_lang in _INDIAN_LANGUAGES or target_lang in _INDIAN_LANGUAGES:
+            return self._indian_choice
+        return self._other_choice
     
-    def _update_stats(self, source_lang: str, target_lang: str, model: str, processing_time: float):
-        """Update translation statistics."""
-        self.stats["total_translations"] += 1
-        self.stats["total_processing_time"] += processing_time
-        self.stats["average_processing_time"] = (
-            self.stats["total_processing_time"] / self.stats["total_translations"]
-        )
-        
-        # Update by model
-        if model not in self.stats["translations_by_model"]:
-            self.stats["translations_by_model"][model] = 0
-        self.stats["translations_by_model"][model] += 1
+    def _resolve_auto_models(self) -> Tuple[Optional[str], Optional[str]]:
+        """Pick the first available model for Indian and for other pairs, once."""
+        indian_choice = next((model for model in _INDIAN_MODEL_PRIORITY if model in self.models), None)
+        other_choice = next((model for model in _OTHER_MODEL_PRIORITY if model in self.models), None)
+        return indian_choice, other_choice
+    
+    def _update_stats(
+        self,
+        source_lang: str,
+        target_lang: str,
+        model: str,
+        processing_time: float,
+        count: int = 1
+    ):
+        """
+        Update translation statistics.
         
-        # Update by language pair
-        lang_pair = f"{source_lang}-{target_lang}"
-        if lang_pair not in self.stats["translations_by_language"]:
-            self.stats["translations_by_language"][lang_pair] = 0
-        self.stats["translations_by_language"][lang_pair] += 1
+        Args:
+            source_lang: Source language code
+            target_lang: Target language code
+            model: Model that produced the translations
+            processing_time: Total time spent on the translations
+            count: Number of translations, so a batch is recorded in one call
+        """
+        # The average is derived in get_stats() rather than on every update
+        self._total_translations += count
+        self._total_processing_time += processing_time
+        self._translations_by_model[model] += count
+        self._translations_by_language[f"{source_lang}-{target_lang}"] += count
     
     async def get_available_models(self) -> List[Dict[str, Any]]:
         """Get information about available models."""
@@ -216,8 +338,9 @@ class TranslationService:
             info = {
                 "name": model_name,
                 "type": type(translator).__name__,
-                "loaded": True,
-                "supported_languages": [lang.code for lang in get_supported_languages()],
+                # ML translators report False until their first load
+                "loaded": getattr(translator, "is_loaded", True),
+                "supported_languages": _SUPPORTED_LANGUAGE_CODES,
                 "description": getattr(translator, 'description', 'Translation model')
             }
             models_info.append(info)
@@ -225,8 +348,189 @@ class TranslationService:
         return models_info
     
     async def get_stats(self) -> Dict[str, Any]:
-        """Get translation service statistics."""
-        return self.stats.copy()
+        """
+        Get translation service statistics.
+        
+        Returns:
+            A snapshot that shares no state with the service, so later
+            translations do not change it
+        """
+        total = self._total_translations
+        return {
+            "total_translations": total,
+            "translations_by_model": dict(self._translations_by_model),
+            "translations_by_language": dict(self._translations_by_language),
+            "average_processing_time": self._total_processing_time / total if total else 0,
+            "total_processing_time": self._total_processing_time
+        }
+
+
+def _length_buckets(lengths: List[int], max_ratio: float = 1.5, min_length: int = 32) -> List[List[int]]:
+    """
+    Group indices of similar lengths, shortest first.
+    
+    A new bucket starts whenever a length exceeds max_ratio times the
+    shortest length in the current bucket. Lengths below min_length count
+    as min_length, since padding short texts costs little and splitting
+    them would only add model calls.
+    """
+    buckets: List[List[int]] = []
+    for index in sorted(range(len(lengths)), key=lengths.__getitem__):
+        if buckets and lengths[index] <= max_ratio * max(lengths[buckets[-1][0]], min_length):
+            buckets[-1].append(index)
+        else:
+            buckets.append([index])
+    return buckets
+
+
+def _fail_future(future: asyncio.Future, error: BaseException):
+    """Resolve future with error unless it already has an outcome."""
+    if not future.done():
+        future.set_exception(error)
+
+
+class BatchScheduler:
+    """
+    Coalesces concurrent single translation requests into batch calls.
+    
+    Requests are queued and a background task drains up to max_batch_size
+    of them, waiting at most max_delay_ms for more to arrive, then sends each
+    (source, target, model) group, split into buckets of similar text
+    length, to TranslationService.translate_batch.
+    The wait is skipped as soon as every outstanding request is already in
+    the batch, so a lone request is dispatched without added latency.
+    Every submitted request is resolved: with its result, with the error
+    that failed its batch, or with a RuntimeError once the scheduler closes.
+    """
+    
+    def __init__(self, service: "TranslationService", max_batch_size: int = 32, max_delay_ms: float = 10.0):
+        self.service = service
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._outstanding = 0
+    
+    async def submit(
+        self,
+        text: str,
+        source_language: str,
+        target_language: str,
+        model: str = "auto"
+    ) -> TranslationResult:
+        """Queue a translation and wait for its batched result."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Queues are bound to their event loop, so a new loop needs a new one
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._outstanding = 0
+            self._worker = None
+        if self._worker is None or self._worker.done():
+            # Requests already queued are picked up by the new worker
+            self._worker = loop.create_task(self._run())
+        
+        future = loop.create_future()
+        self._outstanding += 1
+        self._queue.put_nowait((text, source_language, target_language, model, future))
+        try:
+            return await future
+        finally:
+            self._outstanding -= 1
+    
+    async def close(self) -> None:
+        """Cancel the batching worker and fail queued requests; a later submit starts a new one."""
+        worker, self._worker = self._worker, None
+        if worker is not None and not worker.done():
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
+        
+        if self._queue is not None:
+            while not self._queue.empty():
+                *_, future = self._queue.get_nowait()
+                _fail_future(future, RuntimeError("Batch scheduler closed"))
+    
+    async def _run(self):
+        """Drain the queue into batches until cancelled."""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        
+        while True:
+            batch = [await queue.get()]
+            try:
+                await self._fill(batch, queue, loop.time() + self.max_delay)
+                await self._dispatch(batch)
+            except asyncio.CancelledError:
+                for *_, future in batch:
+                    _fail_future(future, RuntimeError("Batch scheduler closed"))
+                raise
+            except Exception as e:
+                # Keep the worker alive for later batches
+                logger.error(f"Batch dispatch failed: {e}")
+                for *_, future in batch:
+                    _fail_future(future, e)
+    
+    async def _fill(self, batch, queue: asyncio.Queue, deadline: float):
+        """Add queued requests to batch until it is full or the deadline passes."""
+        loop = asyncio.get_running_loop()
+        while len(batch) < self.max_batch_size:
+            if not queue.empty():
+                batch.append(queue.get_nowait())
+                continue
+            
+            # Nobody else is waiting, so holding the batch only adds latency
+            if len(batch) >= self._outstanding:
+                break
+            
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+    
+    async def _dispatch(self, batch):
+        """Translate a drained batch and resolve its futures."""
+        groups = {}
+        for text, source_language, target_language, model, future in batch:
+            groups.setdefault((source_language, target_language, model), []).append((text, future))
+        
+        # Split each group by text length so short texts are not padded to,
+        # or kept waiting on, much longer ones in the same model call
+        buckets = [
+            (key, [items[i] for i in bucket])
+            for key, items in groups.items()
+            for bucket in _length_buckets([len(text) for text, _ in items])
+        ]
+        
+        async def run_group(key, items):
+            source_language, target_language, model = key
+            try:
+                results = await self.service.translate_batch(
+                    texts=[text for text, _ in items],
+                    source_language=source_language,
+                    target_language=target_language,
+                    model=model
+                )
+                if len(results) != len(items):
+                    raise RuntimeError(f"Expected {len(items)} results, got {len(results)}")
+            except Exception as e:
+                if len(items) == 1:
+                    _fail_future(items[0][1], e)
+                    return
+                
+                # One bad text should not fail its batch-mates, so retry alone
+                logger.warning(f"Batch of {len(items)} failed, retrying individually: {e}")
+                await asyncio.gather(*(run_group(key, [item]) for item in items))
+                return
+            
+            for (_, future), result in zip(items, results):
+                if not future.done():
+                    future.set_result(result)
+        
+        await asyncio.gather(*(run_group(key, items) for key, items in buckets))
 
 
 class BaseTranslator:
@@ -238,87 +542,107 @@ class BaseTranslator:
     async def translate(self, text: str, source_lang: str, target_lang: str) -> TranslationResult:
         """Translate text. Must be implemented by subclasses."""
         raise NotImplementedError
+    
+    async def translate_batch(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str
+    ) -> List[TranslationResult]:
+        """Translate several texts; override when the model can batch them."""
+        return list(await asyncio.gather(
+            *(self.translate(text, source_lang, target_lang) for text in texts)
+        ))
 
 
 class MockTranslator(BaseTranslator):
     """Mock translator for development and testing."""
     
-    def __init__(self):
+    # Mock translations for common phrases, built once and shared read-only
+    _MOCK_TRANSLATIONS = MappingProxyType({
+        ("en", "hi"): MappingProxyType({
+            "Hello": "नमस्ते",
+            "Hello world": "नमस्ते संसार",
+            "How are you?": "आप कैसे हैं?",
+            "Good morning": "सुप्रभात",
+            "Thank you": "धन्यवाद",
+            "Welcome": "स्वागत है",
+            "Goodbye": "अलविदा",
+            "Please": "कृपया",
+            "Yes": "हाँ",
+            "No": "नहीं"
+        }),
+        ("en", "ta"): MappingProxyType({
+            "Hello": "வணக்கம்",
+            "Hello world": "வணக்கம் உலகம்",
+            "How are you?": "நீங்கள் எப்படி இருக்கிறீர்கள்?",
+            "Good morning": "காலை வணக்கம்",
+            "Thank you": "நன்றி",
+            "Welcome": "வரவேற்கிறோம்",
+            "Goodbye": "பிரியாவிடை",
+            "Please": "தயவு செய்து",
+            "Yes": "ஆம்",
+            "No": "இல்லை"
+        }),
+        ("en", "te"): MappingProxyType({
+            "Hello": "నమస్కారం",
+            "Hello world": "హలో ప్రపంచం",
+            "How are you?": "మీరు ఎలా ఉన్నారు?",
+            "Good morning": "శుభోదయం",
+            "Thank you": "ధన్యవాదాలు",
+            "Welcome": "స్వాగతం",
+            "Goodbye": "వీడ్కోలు",
+            "Please": "దయచేసి",
+            "Yes": "అవును",
+            "No": "లేదు"
+        }),
+        ("en", "bn"): MappingProxyType({
+            "Hello": "হ্যালো",
+            "Hello world": "হ্যালো বিশ্ব",
+            "How are you?": "আপনি কেমন আছেন?",
+            "Good morning": "সুপ্রভাত",
+            "Thank you": "ধন্যবাদ",
+            "Welcome": "স্বাগতম",
+            "Goodbye": "বিদায়",
+            "Please": "দয়া করে",
+            "Yes": "হ্যাঁ",
+            "No": "না"
+        }),
+        ("en", "mr"): MappingProxyType({
+            "Hello": "नमस्कार",
+            "Hello world": "हॅलो जग",
+            "How are you?": "तुम्ही कसे आहात?",
+            "Good morning": "शुभ सकाळ",
+            "Thank you": "धन्यवाद",
+            "Welcome": "स्वागत",
+            "Goodbye": "निरोप",
+            "Please": "कृपया",
+            "Yes": "होय",
+            "No": "नाही"
+        })
+    })
+    
+    def __init__(self, simulate_latency: bool = False, include_alternatives: bool = False):
+        """
+        Args:
+            simulate_latency: Sleep before answering to imitate model latency
+                (for demos); off by default so the fallback path is not throttled
+            include_alternatives: Attach mock alternatives to multi-word
+                translations; off by default as no response surfaces them
+        """
         super().__init__()
         self.description = "Mock translator for development"
-        
-        # Mock translations for common phrases
-        self.mock_translations = {
-            ("en", "hi"): {
-                "Hello": "नमस्ते",
-                "Hello world": "नमस्ते संसार", 
-                "How are you?": "आप कैसे हैं?",
-                "Good morning": "सुप्रभात",
-                "Thank you": "धन्यवाद",
-                "Welcome": "स्वागत है",
-                "Goodbye": "अलविदा",
-                "Please": "कृपया",
-                "Yes": "हाँ",
-                "No": "नहीं"
-            },
-            ("en", "ta"): {
-                "Hello": "வணக்கம்",
-                "Hello world": "வணக்கம் உலகம்",
-                "How are you?": "நீங்கள் எப்படி இருக்கிறீர்கள்?",
-                "Good morning": "காலை வணக்கம்",
-                "Thank you": "நன்றி",
-                "Welcome": "வரவேற்கிறோம்",
-                "Goodbye": "பிரியாவிடை",
-                "Please": "தயவு செய்து",
-                "Yes": "ஆம்",
-                "No": "இல்லை"
-            },
-            ("en", "te"): {
-                "Hello": "నమస్కారం",
-                "Hello world": "హలో ప్రపంచం",
-                "How are you?": "మీరు ఎలా ఉన్నారు?",
-                "Good morning": "శుభోదయం",
-                "Thank you": "ధన్యవాదాలు",
-                "Welcome": "స్వాగతం",
-                "Goodbye": "వీడ్కోలు",
-                "Please": "దయచేసి",
-                "Yes": "అవును",
-                "No": "లేదు"
-            },
-            ("en", "bn"): {
-                "Hello": "হ্যালো",
-                "Hello world": "হ্যালো বিশ্ব",
-                "How are you?": "আপনি কেমন আছেন?",
-                "Good morning": "সুপ্রভাত",
-                "Thank you": "ধন্যবাদ",
-                "Welcome": "স্বাগতম",
-                "Goodbye": "বিদায়",
-                "Please": "দয়া করে",
-                "Yes": "হ্যাঁ",
-                "No": "না"
-            },
-            ("en", "mr"): {
-                "Hello": "नमस्कार",
-                "Hello world": "हॅलो जग",
-                "How are you?": "तुम्ही कसे आहात?",
-                "Good morning": "शुभ सकाळ",
-                "Thank you": "धन्यवाद",
-                "Welcome": "स्वागत",
-                "Goodbye": "निरोप",
-                "Please": "कृपया",
-                "Yes": "होय",
-                "No": "नाही"
-            }
-        }
+        self.simulate_latency = simulate_latency
+        self.include_alternatives = include_alternatives
     
     async def translate(self, text: str, source_lang: str, target_lang: str) -> TranslationResult:
-        """Mock translation with simulated processing time."""
-        # Simulate processing delay
-        await asyncio.sleep(0.1 + len(text) * 0.001)  # Simulate realistic processing time
+        """Mock translation, optionally with simulated processing time."""
+        if self.simulate_latency:
+            await asyncio.sleep(0.1 + len(text) * 0.001)  # Simulate realistic processing time
         
         # Get mock translation
         lang_pair = (source_lang, target_lang)
-        translations = self.mock_translations.get(lang_pair, {})
+        translations = self._MOCK_TRANSLATIONS.get(lang_pair, {})
         
         # Try exact match first
         if text in translations:
@@ -343,9 +667,9 @@ class MockTranslator(BaseTranslator):
             
             confidence = 0.75  # Lower confidence for unknown phrases
         
-        # Generate mock alternatives
+        # Generate mock alternatives when requested
         alternatives = []
-        if len(text.split()) > 1:  # Only for multi-word phrases
+        if self.include_alternatives and len(text.split(maxsplit=1)) > 1:  # Only for multi-word phrases
             alternatives = [
                 {"text": f"Alt 1: {translated}", "confidence": confidence - 0.1},
                 {"text": f"Alt 2: {translated}", "confidence": confidence - 0.2},
@@ -387,3 +711,20 @@ def get_translation_service() -> TranslationService:
     if _translation_service is None:
         _translation_service = TranslationService()
     return _translation_service
+
+
+async def warmup_translation_service() -> None:
+    """Create the translation service and load its ML models ahead of the first request."""
+    service = get_translation_service()
+    try:
+        from app.services.ml_translators import warmup_all
+    except ImportError as e:
+        logger.warning(f"ML translators not available for warmup: {e}")
+        return
+    await warmup_all(service.models.values())
+
+
+async def shutdown_translation_service() -> None:
+    """Stop background work owned by the translation service, if created."""
+    if _translation_service is not None:
+        await _translation_service.batch_scheduler.close()
@@ -3,6 +3,53 @@ from typing import List, Tuple
 from app.models.language import SupportedLanguage, get_language_by_code
 from app.models.translation import ValidationResult
 
+# Patterns are compiled once at import rather than looked up in re's
+# cache on every call
+_WHITESPACE_RUN = re.compile(r'\s+')
+_CONTROL_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]')
+_SPECIAL_CHAR = re.compile(r'[^\w\s]')
+
+# Script code point ranges, in detect_script_type's tie-break order
+_SCRIPT_RANGES = (
+    ("latin", ((0x0041, 0x005A), (0x0061, 0x007A))),
+    ("devanagari", ((0x0900, 0x097F),)),
+    ("tamil", ((0x0B80, 0x0BFF),)),
+    ("telugu", ((0x0C00, 0x0C7F),)),
+    ("bengali", ((0x0980, 0x09FF),)),
+)
+_SCRIPT_NAMES = tuple(name for name, _ in _SCRIPT_RANGES)
+_SCRIPT_MARKERS = tuple(chr(index + 1) for index in range(len(_SCRIPT_RANGES)))
+
+# Runs of characters outside every script, and a str.translate table mapping
+# each script's code points to that script's marker character
+_NON_SCRIPT_RUN = re.compile("[^" + "".join(
+    f"{re.escape(chr(start))}-{re.escape(chr(end))}"
+    for _, ranges in _SCRIPT_RANGES
+    for start, end in ranges
+) + "]+")
+_SCRIPT_MARKER_TABLE = {
+    code_point: marker
+    for (_, ranges), marker in zip(_SCRIPT_RANGES, _SCRIPT_MARKERS)
+    for start, end in ranges
+    for code_point in range(start, end + 1)
+}
+
+
+# Source languages whose native script is not Latin
+_NON_LATIN_SOURCES = frozenset({'hi', 'ta', 'te', 'bn', 'mr'})
+
+
+def _script_counts(text: str) -> List[int]:
+    """
+    Count characters per script, in _SCRIPT_NAMES order.
+    
+    Like the language detector, this strips other characters with one regex
+    pass and maps the rest to markers with str.translate, instead of running
+    one regex per script over the whole text.
+    """
+    markers = _NON_SCRIPT_RUN.sub("", text).translate(_SCRIPT_MARKER_TABLE)
+    return [markers.count(marker) for marker in _SCRIPT_MARKERS]
+
 def validate_text_content(text: str, max_length: int = 1000) -> ValidationResult:
     """
     Validate text content for translation
@@ -16,9 +63,11 @@ def validate_text_content(text: str, max_length: int = 1000) -> ValidationResult
     """
     errors = []
     
+    # Results are built from values produced here, so model_construct()
+    # skips re-validating them
     if not text:
         errors.append("Text is required")
-        return ValidationResult(is_valid=False, errors=errors)
+        return ValidationResult.model_construct(is_valid=False, errors=errors)
     
     trimmed_text = text.strip()
     
@@ -27,7 +76,7 @@ def validate_text_content(text: str, max_length: int = 1000) -> ValidationResult
     elif len(trimmed_text) > max_length:
         errors.append(f"Text cannot exceed {max_length} characters")
     
-    return ValidationResult(is_valid=len(errors) == 0, errors=errors)
+    return ValidationResult.model_construct(is_valid=len(errors) == 0, errors=errors)
 
 def validate_language_pair(source: str, target: str) -> ValidationResult:
     """
@@ -62,7 +111,8 @@ def validate_language_pair(source: str, target: str) -> ValidationResult:
             if not target_lang:
                 errors.append(f"Target language '{target}' is not supported")
     
-    return ValidationResult(is_valid=len(errors) == 0, errors=errors)
+    # Built from values produced here, so re-validation is skipped
+    return ValidationResult.model_construct(is_valid=len(errors) == 0, errors=errors)
 
 def sanitize_text(text: str) -> str:
     """
@@ -78,10 +128,10 @@ def sanitize_text(text: str) -> str:
         return ""
     
     # Normalize whitespace
-    sanitized = re.sub(r'\s+', ' ', text.strip())
+    sanitized = _WHITESPACE_RUN.sub(' ', text.strip())
     
     # Remove control characters except newlines and tabs
-    sanitized = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]', '', sanitized)
+    sanitized = _CONTROL_CHARS.sub('', sanitized)
     
     return sanitized
 
@@ -98,23 +148,11 @@ def detect_script_type(text: str) -> str:
     if not text:
         return "latin"
     
-    # Script detection patterns
-    patterns = {
-        "latin": r'[a-zA-Z]',
-        "devanagari": r'[\u0900-\u097F]',
-        "tamil": r'[\u0B80-\u0BFF]',
-        "telugu": r'[\u0C00-\u0C7F]',
-        "bengali": r'[\u0980-\u09FF]'
-    }
-    
-    script_counts = {}
-    for script, pattern in patterns.items():
-        matches = re.findall(pattern, text)
-        script_counts[script] = len(matches)
+    counts = _script_counts(text)
     
     # Return script with highest count
-    primary_script = max(script_counts, key=script_counts.get)
-    return primary_script if script_counts[primary_script] > 0 else "latin"
+    primary = max(range(len(counts)), key=counts.__getitem__)
+    return _SCRIPT_NAMES[primary] if counts[primary] > 0 else "latin"
 
 def has_mixed_scripts(text: str) -> bool:
     """
@@ -129,20 +167,8 @@ def has_mixed_scripts(text: str) -> bool:
     if not text:
         return False
     
-    patterns = {
-        "latin": r'[a-zA-Z]',
-        "devanagari": r'[\u0900-\u097F]',
-        "tamil": r'[\u0B80-\u0BFF]',
-        "telugu": r'[\u0C00-\u0C7F]',
-        "bengali": r'[\u0980-\u09FF]'
-    }
-    
-    script_found = []
-    for script, pattern in patterns.items():
-        if re.search(pattern, text):
-            script_found.append(script)
-    
-    return len(script_found) > 1
+    scripts_found = sum(1 for count in _script_counts(text) if count)
+    return scripts_found > 1
 
 def estimate_translation_difficulty(text: str, source_lang: str, target_lang: str) -> float:
     """
@@ -167,35 +193,37 @@ def estimate_translation_difficulty(text: str, source_lang: str, target_lang: st
             difficulty += 0.3
     
     # Difficulty based on text characteristics
-    if len(text) > 500:
+    text_length = len(text)
+    if text_length > 500:
         difficulty += 0.2
     
     if has_mixed_scripts(text):
         difficulty += 0.3
     
-    # Special characters and numbers
-    special_chars = len(re.findall(r'[^\w\s]', text))
-    if special_chars > len(text) * 0.1:
+    # Special characters and numbers, counted without building a match list
+    special_chars = text_length - len(_SPECIAL_CHAR.sub('', text))
+    if special_chars > text_length * 0.1:
         difficulty += 0.2
     
     return min(difficulty, 1.0)
 
-def get_supported_language_pairs() -> List[Tuple[str, str]]:
+# Every ordered pair of distinct supported languages, built once at import
+_SUPPORTED_LANGUAGE_PAIRS = tuple(
+    (source.value, target.value)
+    for source in SupportedLanguage
+    for target in SupportedLanguage
+    if source != target
+)
+
+def get_supported_language_pairs() -> Tuple[Tuple[str, str], ...]:
     """
     Get all supported language pairs
     
     Returns:
-        List of (source, target) language code tuples
+        Immutable tuple of (source, target) language code tuples, shared
+        between callers
     """
-    languages = list(SupportedLanguage)
-    pairs = []
-    
-    for source in languages:
-        for target in languages:
-            if source != target:
-                pairs.append((source.value, target.value))
-    
-    return pairs
+    return _SUPPORTED_LANGUAGE_PAIRS
 
 def is_transliteration_candidate(text: str, source_lang: str) -> bool:
     """
@@ -212,9 +240,11 @@ def is_transliteration_candidate(text: str, source_lang: str) -> bool:
         return False
     
     # Check for Latin script in non-Latin source languages
-    if source_lang in ['hi', 'ta', 'te', 'bn', 'mr']:
-        latin_chars = len(re.findall(r'[a-zA-Z]', text))
-        total_chars = len(re.findall(r'[a-zA-Z\u0900-\u097F\u0B80-\u0BFF\u0C00-\u0C7F\u0980-\u09FF]', text))
+    if source_lang in _NON_LATIN_SOURCES:
+        # Only the Latin count is needed; the total is the stripped length
+        markers = _NON_SCRIPT_RUN.sub("", text).translate(_SCRIPT_MARKER_TABLE)
+        latin_chars = markers.count(_SCRIPT_MARKERS[0])
+        total_chars = len(markers)
         
         if total_chars > 0 and latin_chars / total_chars > 0.5:
             return True
@@ -2,62 +2,67 @@
 """
 Test script for the NLP Translation API
 """
-import requests
+import asyncio
+import httpx
 import json
 import time
 
 BASE_URL = "http://localhost:8001"
 
-def test_health():
+async def test_health(client):
     """Test the health endpoint"""
-    print("Testing health endpoint...")
-    response = requests.get(f"{BASE_URL}/health")
-    print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
-    print()
+    return "health endpoint", await client.get("/health")
 
-def test_translation():
+async def test_translation(client):
     """Test the translation endpoint"""
-    print("Testing translation endpoint...")
     payload = {
         "text": "Hello, how are you?",
         "source_language": "en",
         "target_language": "hi"
     }
     
-    response = requests.post(f"{BASE_URL}/api/v1/translate/", json=payload)
-    print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
-    print()
+    return "translation endpoint", await client.post("/api/v1/translate/", json=payload)
 
-def test_languages():
+async def test_languages(client):
     """Test the languages endpoint"""
-    print("Testing languages endpoint...")
-    response = requests.get(f"{BASE_URL}/api/v1/languages/")
-    print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
-    print()
+    return "languages endpoint", await client.get("/api/v1/languages/")
 
-def test_language_pairs():
+async def test_language_pairs(client):
     """Test the language pairs endpoint"""
-    print("Testing language pairs endpoint...")
-    response = requests.get(f"{BASE_URL}/api/v1/languages/pairs")
-    print(f"Status: {response.status_code}")
+    return "language pairs endpoint", await client.get("/api/v1/languages/pairs")
+
+def print_result(name, response):
+    """Print one test's response"""
+    print(f"Testing {name}...")
+    print(f"Status: {response.status_code} ({response.elapsed.total_seconds():.3f}s)")
     print(f"Response: {json.dumps(response.json(), indent=2)}")
     print()
 
+async def run_tests():
+    """Run all tests concurrently over one client, then report them in order"""
+    # Translation may have to load a model, so the timeout is generous
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=60.0) as client:
+        results = await asyncio.gather(
+            test_health(client),
+            test_translation(client),
+            test_languages(client),
+            test_language_pairs(client)
+        )
+    
+    for name, response in results:
+        print_result(name, response)
+
 if __name__ == "__main__":
     print("NLP Translation API Test Suite")
     print("=" * 40)
     
+    start_time = time.perf_counter()
+    
     try:
-        test_health()
-        test_translation()
-        test_languages()
-        test_language_pairs()
-        print("All tests completed successfully!")
+        asyncio.run(run_tests())
+        print(f"All tests completed successfully in {time.perf_counter() - start_time:.2f}s!")
         
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print("Error: Could not connect to the API server.")
         print("Make sure the server is running on http://localhost:8001")
     except Exception as e:
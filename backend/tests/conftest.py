@@ -0,0 +1,7 @@
+import pytest
+from app.models.language import LANGUAGE_CONFIGS
+
+@pytest.fixture(scope="session")
+def code_map():
+    """Language configurations keyed by plain language code"""
+    return {language.value: config for language, config in LANGUAGE_CONFIGS.items()}
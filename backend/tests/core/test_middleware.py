@@ -0,0 +1,137 @@
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.core.middleware import EdgeMiddleware, set_performance_logger
+
+ALLOWED_ORIGIN = "http://localhost:3000"
+PREFLIGHT_HEADERS = {
+    "Origin": ALLOWED_ORIGIN,
+    "Access-Control-Request-Method": "POST",
+    "Access-Control-Request-Headers": "content-type",
+}
+
+
+async def _echo(request):
+    return PlainTextResponse("ok", headers={"Vary": "Accept-Encoding"})
+
+
+@pytest.fixture
+def client():
+    app = Starlette(routes=[Route("/echo", _echo, methods=["GET", "POST"])])
+    app.add_middleware(
+        EdgeMiddleware,
+        allowed_hosts=["localhost", "*.example.com"],
+        allow_origins=[ALLOWED_ORIGIN]
+    )
+    return TestClient(app, base_url="http://localhost")
+
+
+class TestHostValidation:
+    """Test Host header validation"""
+    
+    @pytest.mark.parametrize("host", ["localhost", "localhost:8000", "api.example.com"])
+    def test_allowed_host(self, client, host):
+        """Test that allowlisted hosts and subdomains are accepted"""
+        response = client.get("/echo", headers={"Host": host})
+        assert response.status_code == 200
+    
+    @pytest.mark.parametrize("host", ["evil.com", "example.com.evil.com"])
+    def test_disallowed_host(self, client, host):
+        """Test that other hosts get a 400"""
+        response = client.get("/echo", headers={"Host": host})
+        
+        assert response.status_code == 400
+        assert response.text == "Invalid host header"
+        assert "x-process-time" in response.headers
+
+
+class TestPreflight:
+    """Test CORS preflight requests"""
+    
+    def test_allowed_origin(self, client):
+        """Test that a preflight from an allowed origin is answered without reaching the app"""
+        response = client.options("/echo", headers=PREFLIGHT_HEADERS)
+        
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == ALLOWED_ORIGIN
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert response.headers["access-control-allow-headers"] == "content-type"
+        assert "POST" in response.headers["access-control-allow-methods"]
+        assert response.headers["access-control-max-age"] == "600"
+    
+    def test_disallowed_origin(self, client):
+        """Test that a preflight from another origin gets a 400"""
+        response = client.options("/echo", headers={**PREFLIGHT_HEADERS, "Origin": "http://evil.com"})
+        
+        assert response.status_code == 400
+        assert response.text == "Disallowed CORS origin"
+        assert "access-control-allow-origin" not in response.headers
+    
+    def test_private_network_request(self, client):
+        """Test that private network access is refused"""
+        response = client.options(
+            "/echo",
+            headers={**PREFLIGHT_HEADERS, "Access-Control-Request-Private-Network": "true"}
+        )
+        
+        assert response.status_code == 400
+        assert response.text == "Disallowed CORS private-network"
+
+
+class TestSimpleRequests:
+    """Test CORS headers on simple (non-preflight) requests"""
+    
+    def test_allowed_origin(self, client):
+        """Test that an allowed origin is echoed back with credentials"""
+        response = client.post("/echo", headers={"Origin": ALLOWED_ORIGIN})
+        
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == ALLOWED_ORIGIN
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert response.headers["vary"] == "Accept-Encoding, Origin"
+    
+    def test_disallowed_origin(self, client):
+        """Test that another origin is not granted access"""
+        response = client.post("/echo", headers={"Origin": "http://evil.com"})
+        
+        assert response.status_code == 200
+        assert "access-control-allow-origin" not in response.headers
+        assert response.headers["vary"] == "Accept-Encoding, Origin"
+    
+    def test_no_origin(self, client):
+        """Test that same-origin requests get no CORS headers"""
+        response = client.get("/echo")
+        
+        assert "access-control-allow-credentials" not in response.headers
+        assert response.headers["vary"] == "Accept-Encoding, Origin"
+
+
+class TestRequestTiming:
+    """Test request timing and performance logging"""
+    
+    def test_process_time_header(self, client):
+        """Test that every response carries its processing time"""
+        response = client.get("/echo")
+        assert float(response.headers["x-process-time"]) >= 0
+    
+    def test_performance_logger(self, client):
+        """Test that each request is reported to the bound performance logger"""
+        calls = []
+        
+        class RecordingLogger:
+            def log_api_request(self, **kwargs):
+                calls.append(kwargs)
+        
+        set_performance_logger(RecordingLogger())
+        try:
+            client.post("/echo")
+        finally:
+            set_performance_logger(None)
+        
+        assert len(calls) == 1
+        assert calls[0]["endpoint"] == "/echo"
+        assert calls[0]["method"] == "POST"
+        assert calls[0]["status_code"] == 200
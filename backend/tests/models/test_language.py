@@ -12,21 +12,27 @@ from app.models.language import (
     is_language_pair_supported
 )
 
+# Every supported language, enumerated once for the whole module
+_ALL_LANGUAGES = frozenset(SupportedLanguage)
+
 class TestSupportedLanguage:
     """Test SupportedLanguage enum"""
     
-    def test_supported_language_values(self):
+    @pytest.mark.parametrize("language,code", [
+        (SupportedLanguage.ENGLISH, "en"),
+        (SupportedLanguage.HINDI, "hi"),
+        (SupportedLanguage.TAMIL, "ta"),
+        (SupportedLanguage.TELUGU, "te"),
+        (SupportedLanguage.BENGALI, "bn"),
+        (SupportedLanguage.MARATHI, "mr"),
+    ])
+    def test_supported_language_values(self, language, code):
         """Test that all required languages are supported"""
-        assert SupportedLanguage.ENGLISH == "en"
-        assert SupportedLanguage.HINDI == "hi"
-        assert SupportedLanguage.TAMIL == "ta"
-        assert SupportedLanguage.TELUGU == "te"
-        assert SupportedLanguage.BENGALI == "bn"
-        assert SupportedLanguage.MARATHI == "mr"
+        assert language == code
     
     def test_supported_language_count(self):
         """Test that we have the expected number of supported languages"""
-        assert len(list(SupportedLanguage)) == 6
+        assert len(_ALL_LANGUAGES) == 6
 
 class TestLanguageModel:
     """Test Language model validation and structure"""
@@ -105,10 +111,7 @@ class TestLanguageConfigs:
     
     def test_language_configs_completeness(self):
         """Test that all supported languages have configurations"""
-        expected_languages = set(SupportedLanguage)
-        configured_languages = set(LANGUAGE_CONFIGS.keys())
-        
-        assert expected_languages == configured_languages
+        assert set(LANGUAGE_CONFIGS.keys()) == _ALL_LANGUAGES
     
     def test_language_configs_structure(self):
         """Test that all language configs have proper structure"""
@@ -118,29 +121,25 @@ class TestLanguageConfigs:
             assert len(config.name) > 0
             assert len(config.native_name) > 0
     
-    def test_indian_language_native_names(self):
+    @pytest.mark.parametrize("code,native_name", [
+        ("hi", "हिन्दी"),
+        ("ta", "தமிழ்"),
+        ("te", "తెలుగు"),
+        ("bn", "বাংলা"),
+        ("mr", "मराठी"),
+    ])
+    def test_indian_language_native_names(self, code_map, code, native_name):
         """Test that Indian languages have proper native names"""
-        hindi_config = LANGUAGE_CONFIGS[SupportedLanguage.HINDI]
-        tamil_config = LANGUAGE_CONFIGS[SupportedLanguage.TAMIL]
-        telugu_config = LANGUAGE_CONFIGS[SupportedLanguage.TELUGU]
-        bengali_config = LANGUAGE_CONFIGS[SupportedLanguage.BENGALI]
-        marathi_config = LANGUAGE_CONFIGS[SupportedLanguage.MARATHI]
-        
-        assert hindi_config.native_name == "हिन्दी"
-        assert tamil_config.native_name == "தமிழ்"
-        assert telugu_config.native_name == "తెలుగు"
-        assert bengali_config.native_name == "বাংলা"
-        assert marathi_config.native_name == "मराठी"
-    
-    def test_script_types_correct(self):
+        assert code_map[code].native_name == native_name
+    
+    @pytest.mark.parametrize("code,script_type", [
+        ("hi", ScriptType.DEVANAGARI),
+        ("ta", ScriptType.TAMIL),
+        ("en", ScriptType.LATIN),
+    ])
+    def test_script_types_correct(self, code_map, code, script_type):
         """Test that languages have correct script types"""
-        hindi_config = LANGUAGE_CONFIGS[SupportedLanguage.HINDI]
-        tamil_config = LANGUAGE_CONFIGS[SupportedLanguage.TAMIL]
-        english_config = LANGUAGE_CONFIGS[SupportedLanguage.ENGLISH]
-        
-        assert hindi_config.script_type == ScriptType.DEVANAGARI
-        assert tamil_config.script_type == ScriptType.TAMIL
-        assert english_config.script_type == ScriptType.LATIN
+        assert code_map[code].script_type == script_type
 
 class TestLanguageUtils:
     """Test language utility functions"""
@@ -154,8 +153,12 @@ class TestLanguageUtils:
         
         # Check that all expected languages are present
         codes = {lang.code for lang in languages}
-        expected_codes = {lang for lang in SupportedLanguage}
-        assert codes == expected_codes
+        assert codes == _ALL_LANGUAGES
+    
+    def test_get_language_by_code_matches_configs(self, code_map):
+        """Test that lookup by code returns the shared configuration"""
+        for code, language in code_map.items():
+            assert get_language_by_code(code) is language
     
     def test_get_language_by_code_valid(self):
         """Test getting language by valid code"""
@@ -172,45 +175,50 @@ class TestLanguageUtils:
         
         assert invalid_lang is None
     
+    def test_get_language_by_code_enum_member(self):
+        """Test getting language by enum member instead of raw code"""
+        assert get_language_by_code(SupportedLanguage.HINDI) is get_language_by_code("hi")
+        assert is_language_pair_supported(SupportedLanguage.ENGLISH, "hi") is True
+    
     def test_get_language_by_code_empty(self):
         """Test getting language by empty code"""
         empty_lang = get_language_by_code("")
         
         assert empty_lang is None
     
-    def test_is_language_pair_supported_valid(self):
+    @pytest.mark.parametrize("source,target", [("en", "hi"), ("hi", "en"), ("ta", "te")])
+    def test_is_language_pair_supported_valid(self, source, target):
         """Test checking valid language pairs"""
-        assert is_language_pair_supported("en", "hi") is True
-        assert is_language_pair_supported("hi", "en") is True
-        assert is_language_pair_supported("ta", "te") is True
+        assert is_language_pair_supported(source, target) is True
     
-    def test_is_language_pair_supported_same_language(self):
+    @pytest.mark.parametrize("source,target", [("en", "en"), ("hi", "hi")])
+    def test_is_language_pair_supported_same_language(self, source, target):
         """Test checking same language pairs"""
-        assert is_language_pair_supported("en", "en") is False
-        assert is_language_pair_supported("hi", "hi") is False
+        assert is_language_pair_supported(source, target) is False
     
-    def test_is_language_pair_supported_invalid(self):
+    @pytest.mark.parametrize("source,target", [("en", "xyz"), ("xyz", "hi"), ("abc", "def")])
+    def test_is_language_pair_supported_invalid(self, source, target):
         """Test checking invalid language pairs"""
-        assert is_language_pair_supported("en", "xyz") is False
-        assert is_language_pair_supported("xyz", "hi") is False
-        assert is_language_pair_supported("abc", "def") is False
+        assert is_language_pair_supported(source, target) is False
     
-    def test_is_language_pair_supported_empty(self):
+    @pytest.mark.parametrize("source,target", [("", "hi"), ("en", ""), ("", "")])
+    def test_is_language_pair_supported_empty(self, source, target):
         """Test checking empty language codes"""
-        assert is_language_pair_supported("", "hi") is False
-        assert is_language_pair_supported("en", "") is False
-        assert is_language_pair_supported("", "") is False
+        assert is_language_pair_supported(source, target) is False
 
 class TestEnumValues:
     """Test enum value consistency"""
     
-    def test_script_type_values(self):
+    @pytest.mark.parametrize("script_type,value", [
+        (ScriptType.LATIN, "latin"),
+        (ScriptType.DEVANAGARI, "devanagari"),
+        (ScriptType.TAMIL, "tamil"),
+        (ScriptType.TELUGU, "telugu"),
+        (ScriptType.BENGALI, "bengali"),
+    ])
+    def test_script_type_values(self, script_type, value):
         """Test ScriptType enum values"""
-        assert ScriptType.LATIN == "latin"
-        assert ScriptType.DEVANAGARI == "devanagari"
-        assert ScriptType.TAMIL == "tamil"
-        assert ScriptType.TELUGU == "telugu"
-        assert ScriptType.BENGALI == "bengali"
+        assert script_type == value
     
     def test_text_direction_values(self):
         """Test TextDirection enum values"""
@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+
+from app.services.translation_service import BatchScheduler, TranslationResult
+
+
+class FakeService:
+    """Records translate_batch calls; texts starting with "bad" fail their batch"""
+    
+    def __init__(self, drop_result=False):
+        self.calls = []
+        self.drop_result = drop_result
+    
+    async def translate_batch(self, texts, source_language, target_language, model="auto"):
+        self.calls.append(list(texts))
+        if any(text.startswith("bad") for text in texts):
+            raise ValueError("bad text")
+        results = [TranslationResult(f"{target_language}:{text}", 1.0, model) for text in texts]
+        return results[:-1] if self.drop_result else results
+
+
+@pytest.fixture
+def service():
+    return FakeService()
+
+
+@pytest.fixture
+def scheduler(service):
+    return BatchScheduler(service, max_batch_size=8, max_delay_ms=50)
+
+
+async def _submit_all(scheduler, texts, target_language="hi"):
+    return await asyncio.gather(
+        *(scheduler.submit(text, "en", target_language) for text in texts),
+        return_exceptions=True
+    )
+
+
+class TestBatchScheduler:
+    """Test BatchScheduler coalescing and failure handling"""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_coalesced(self, scheduler, service):
+        """Test that concurrent requests share one batch call"""
+        results = await _submit_all(scheduler, ["one", "two", "six"])
+        
+        assert [result.translated_text for result in results] == ["hi:one", "hi:two", "hi:six"]
+        assert service.calls == [["one", "two", "six"]]
+        await scheduler.close()
+    
+    @pytest.mark.asyncio
+    async def test_language_pairs_are_batched_separately(self, scheduler, service):
+        """Test that each target language gets its own batch call"""
+        results = await asyncio.gather(
+            scheduler.submit("one", "en", "hi"),
+            scheduler.submit("two", "en", "ta")
+        )
+        
+        assert [result.translated_text for result in results] == ["hi:one", "ta:two"]
+        assert sorted(service.calls) == [["one"], ["two"]]
+        await scheduler.close()
+    
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried_individually(self, scheduler, service):
+        """Test that one bad text fails only its own request"""
+        results = await _submit_all(scheduler, ["one", "bad", "two"])
+        
+        assert results[0].translated_text == "hi:one"
+        assert isinstance(results[1], ValueError)
+        assert results[2].translated_text == "hi:two"
+        assert service.calls[0] == ["one", "bad", "two"]
+        assert sorted(service.calls[1:]) == [["bad"], ["one"], ["two"]]
+        await scheduler.close()
+    
+    @pytest.mark.asyncio
+    async def test_missing_results_fail_requests(self, scheduler):
+        """Test that a short result list fails requests instead of leaving them pending"""
+        scheduler.service = FakeService(drop_result=True)
+        
+        results = await asyncio.wait_for(_submit_all(scheduler, ["one", "two"]), timeout=1)
+        
+        assert all(isinstance(result, RuntimeError) for result in results)
+        await scheduler.close()
+    
+    @pytest.mark.asyncio
+    async def test_dispatch_error_fails_batch_and_keeps_worker(self, scheduler, monkeypatch):
+        """Test that an unexpected dispatch error fails the batch without stopping the worker"""
+        async def broken_dispatch(batch):
+            raise KeyError("boom")
+        
+        monkeypatch.setattr(scheduler, "_dispatch", broken_dispatch)
+        results = await asyncio.wait_for(_submit_all(scheduler, ["one", "two"]), timeout=1)
+        assert all(isinstance(result, KeyError) for result in results)
+        
+        monkeypatch.undo()
+        result = await asyncio.wait_for(scheduler.submit("three", "en", "hi"), timeout=1)
+        assert result.translated_text == "hi:three"
+        await scheduler.close()
+    
+    @pytest.mark.asyncio
+    async def test_close_fails_pending_requests(self, scheduler, service):
+        """Test that closing the scheduler fails requests still waiting"""
+        started = asyncio.Event()
+        
+        async def slow_translate_batch(texts, source_language, target_language, model="auto"):
+            started.set()
+            await asyncio.sleep(10)
+        
+        service.translate_batch = slow_translate_batch
+        pending = asyncio.ensure_future(_submit_all(scheduler, ["one", "two"]))
+        await started.wait()
+        queued = asyncio.ensure_future(scheduler.submit("three", "en", "hi"))
+        await asyncio.sleep(0)
+        
+        await scheduler.close()
+        
+        results = await asyncio.wait_for(pending, timeout=1)
+        assert all(isinstance(result, RuntimeError) for result in results)
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(queued, timeout=1)
+    
+    @pytest.mark.asyncio
+    async def test_restart_keeps_queued_requests(self, scheduler):
+        """Test that a new worker picks up requests queued while none was running"""
+        await scheduler.submit("one", "en", "hi")
+        scheduler._worker.cancel()
+        await asyncio.gather(scheduler._worker, return_exceptions=True)
+        
+        orphan = asyncio.get_running_loop().create_future()
+        scheduler._queue.put_nowait(("two", "en", "hi", "auto", orphan))
+        result = await asyncio.wait_for(scheduler.submit("three", "en", "hi"), timeout=1)
+        
+        assert result.translated_text == "hi:three"
+        assert (await asyncio.wait_for(orphan, timeout=1)).translated_text == "hi:two"
+        await scheduler.close()
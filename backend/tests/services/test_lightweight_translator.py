@@ -0,0 +1,45 @@
+import pytest
+
+from app.services.ml_translators import LightweightIndicTransTranslator
+
+
+@pytest.fixture
+def translator():
+    return LightweightIndicTransTranslator()
+
+
+class TestLightweightPhraseMatching:
+    """Test in-text phrase matching of the lightweight translator"""
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("text", ["no-one", "yes-man", "x-yes", "well-come"])
+    async def test_hyphenated_words_are_kept(self, translator, text):
+        """Test that table entries inside hyphenated words are not translated"""
+        result = await translator.translate(text, "en", "hi")
+        assert result.translated_text == text
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("text,expected", [
+        ("I said hello world today", "i said नमस्ते संसार today"),
+        ("say thank you, please", "say धन्यवाद, कृपया"),
+        ("well, good morning!", "well, सुप्रभात!"),
+    ])
+    async def test_multi_word_phrases_in_text(self, translator, text, expected):
+        """Test that multi-word phrases are translated inside longer text"""
+        result = await translator.translate(text, "en", "hi")
+        assert result.translated_text == expected
+    
+    @pytest.mark.asyncio
+    async def test_devanagari_phrases_in_text(self, translator):
+        """Test that Hindi phrases with vowel signs are matched as whole words"""
+        result = await translator.translate("मैं ठीक हूँ और नमस्ते", "hi", "en")
+        assert result.translated_text == "i am fine और hello"
+    
+    @pytest.mark.asyncio
+    async def test_batch_matches_single(self, translator):
+        """Test that batch translation gives the same text as single calls"""
+        texts = ["no-one", "I said hello world today"]
+        results = await translator.translate_batch(texts, "en", "hi")
+        singles = [await translator.translate(text, "en", "hi") for text in texts]
+        
+        assert [r.translated_text for r in results] == [r.translated_text for r in singles]
@@ -0,0 +1,58 @@
+import pytest
+
+from app.services.translation_service import BaseTranslator, TranslationResult, TranslationService
+
+
+class FlakyTranslator(BaseTranslator):
+    """Fails (returning fallback output like MLModelTranslator) on its first call only"""
+    
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+    
+    async def translate(self, text, source_lang, target_lang):
+        self.calls += 1
+        if self.calls == 1:
+            return TranslationResult(f"[flaky failed] {text}", 0.1, "flaky_fallback")
+        return TranslationResult(f"{target_lang}:{text}", 0.9, "flaky")
+
+
+@pytest.fixture
+def service():
+    service = TranslationService()
+    service.models["flaky"] = FlakyTranslator()
+    return service
+
+
+class TestResultCache:
+    """Test which results TranslationService serves from its result cache"""
+    
+    @pytest.mark.asyncio
+    async def test_fallback_result_is_not_cached(self, service):
+        """Test that output of a failed model is retried on the next call"""
+        first = await service.translate("hello", "en", "hi", model="flaky")
+        second = await service.translate("hello", "en", "hi", model="flaky")
+        
+        assert first.translated_text == "[flaky failed] hello"
+        assert second.translated_text == "hi:hello"
+        assert service.models["flaky"].calls == 2
+    
+    @pytest.mark.asyncio
+    async def test_fallback_batch_result_is_not_cached(self, service):
+        """Test that batch translation does not cache fallback output either"""
+        first = await service.translate_batch(["hello"], "en", "hi", model="flaky")
+        second = await service.translate_batch(["hello"], "en", "hi", model="flaky")
+        
+        assert first[0].translated_text == "[flaky failed] hello"
+        assert second[0].translated_text == "hi:hello"
+    
+    @pytest.mark.asyncio
+    async def test_successful_result_is_cached(self, service):
+        """Test that a good result is served from the cache, attributed to the selected model"""
+        await service.translate("hello", "en", "hi", model="flaky")
+        second = await service.translate("hello", "en", "hi", model="flaky")
+        third = await service.translate("hello", "en", "hi", model="flaky")
+        
+        assert third.translated_text == second.translated_text == "hi:hello"
+        assert third.model_used == "flaky"
+        assert service.models["flaky"].calls == 2
@@ -1,11 +1,10 @@
 """
 ML model inference module.
+
+Classes are imported on first access (PEP 562), so importing the package
+does not pull in torch and transformers until a model class is needed.
 """
-from .model_loader import ModelLoader
-from .base_model import BaseMLModel
-from .indictrans_model import IndicTransModel
-from .m2m100_model import M2M100Model
-from .mbart_model import MBartModel
+import importlib
 
 __all__ = [
     "ModelLoader",
@@ -14,3 +13,26 @@ __all__ = [
     "M2M100Model",
     "MBartModel"
 ]
+
+# Submodule defining each exported name
+_SUBMODULES = {
+    "ModelLoader": "model_loader",
+    "BaseMLModel": "base_model",
+    "IndicTransModel": "indictrans_model",
+    "M2M100Model": "m2m100_model",
+    "MBartModel": "mbart_model"
+}
+
+
+def __getattr__(name):
+    submodule = _SUBMODULES.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,9 +2,12 @@
 Base ML model class for translation models.
 """
 import asyncio
+import hashlib
 import time
+from collections import OrderedDict
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 import logging
 
@@ -41,9 +44,38 @@ class ModelResult:
         return max(self.predictions, key=lambda p: p.confidence)
 
 
+def length_buckets(lengths: List[int], max_ratio: float = 1.5) -> List[List[int]]:
+    """
+    Group sequence indices into buckets of similar length.
+    
+    Indices are sorted by length and a new bucket starts whenever a sequence
+    is more than max_ratio times longer than the shortest one in the current
+    bucket, so padding each bucket to its longest member wastes little.
+    
+    Args:
+        lengths: Length of each sequence (e.g. in tokens)
+        max_ratio: Maximum longest/shortest length ratio within a bucket
+        
+    Returns:
+        Buckets of indices into lengths, shortest sequences first
+    """
+    buckets: List[List[int]] = []
+    for index in sorted(range(len(lengths)), key=lengths.__getitem__):
+        if buckets and lengths[index] <= max_ratio * max(lengths[buckets[-1][0]], 1):
+            buckets[-1].append(index)
+        else:
+            buckets.append([index])
+    return buckets
+
+
 class BaseMLModel(ABC):
     """Abstract base class for ML translation models."""
     
+    # Set by models using _translate_in_buckets: the model type reported in
+    # prediction metadata and the confidence given to every prediction
+    _model_type: str
+    _confidence: float
+    
     def __init__(self, model_name: str, model_path: Optional[str] = None):
         self.model_name = model_name
         self.model_path = model_path
@@ -53,6 +85,19 @@ class BaseMLModel(ABC):
         self.supported_languages = set()
         self._model = None
         self._tokenizer = None
+        # API language codes mapped to the model's own language codes
+        self.lang_mapping: Dict[str, str] = {}
+        # Inference runs off the event loop, one call at a time per model:
+        # the forward pass is blocking and the tokenizer keeps per-call
+        # state (src_lang) that concurrent calls would overwrite
+        self._inference_executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix=f"inference-{model_name}"
+        )
+        # Encoder hidden states of recent source texts, keyed by (source language,
+        # text digest); only touched from the inference thread
+        self._encoder_cache: "OrderedDict[Tuple[str, bytes], Any]" = OrderedDict()
+        self.encoder_cache_size = 128
         
     async def load_model(self) -> bool:
         """
@@ -135,6 +180,187 @@ class BaseMLModel(ABC):
         """Implementation-specific translation logic."""
         pass
     
+    async def translate_batch(
+        self, 
+        texts: List[str], 
+        source_lang: str, 
+        target_lang: str,
+        **kwargs
+    ) -> List[ModelResult]:
+        """
+        Translate several texts sharing a language pair.
+        
+        Args:
+            texts: Texts to translate
+            source_lang: Source language code
+            target_lang: Target language code
+            **kwargs: Additional model-specific parameters
+            
+        Returns:
+            ModelResults in the same order as texts; processing_time is the
+            batch time divided evenly between them
+        """
+        if not self.is_loaded:
+            await self.load_model()
+            
+        if not self.is_loaded:
+            raise RuntimeError(f"Model {self.model_name} is not loaded")
+            
+        if not self.supports_language_pair(source_lang, target_lang):
+            raise ValueError(f"Language pair {source_lang}->{target_lang} not supported by {self.model_name}")
+        
+        if not texts:
+            return []
+        
+        start_time = time.time()
+        try:
+            results = await self._translate_batch_impl(texts, source_lang, target_lang, **kwargs)
+            processing_time = (time.time() - start_time) / len(texts)
+            for result in results:
+                result.processing_time = processing_time
+            return results
+        except Exception as e:
+            logger.error(f"Batch translation error in {self.model_name}: {e}")
+            raise
+    
+    async def _translate_batch_impl(
+        self, 
+        texts: List[str], 
+        source_lang: str, 
+        target_lang: str,
+        **kwargs
+    ) -> List[ModelResult]:
+        """Implementation-specific batch logic; defaults to one text at a time."""
+        return [
+            await self._translate_impl(text, source_lang, target_lang, **kwargs)
+            for text in texts
+        ]
+    
+    async def _translate_in_buckets(
+        self, 
+        texts: List[str], 
+        source_lang: str, 
+        target_lang: str
+    ) -> List[ModelResult]:
+        """
+        Translate texts in length buckets, one generate() call per bucket.
+        
+        Shared batch implementation for seq2seq models with a HuggingFace
+        tokenizer; models adapt it through _prepare_input and _forced_bos_id.
+        """
+        import torch
+        
+        # Map language codes
+        src_lang = self.lang_mapping.get(source_lang)
+        tgt_lang = self.lang_mapping.get(target_lang)
+        
+        if not src_lang or not tgt_lang:
+            raise ValueError(f"Language mapping not found for {source_lang}->{target_lang}")
+        
+        # Run inference on the model's own thread to avoid blocking
+        loop = asyncio.get_running_loop()
+        
+        def translate_sync():
+            # Tokenize once; each bucket is padded only to its own longest text
+            encoded = self._tokenizer(
+                [self._prepare_input(text, src_lang) for text in texts],
+                truncation=True,
+                max_length=512
+            )["input_ids"]
+            
+            translated_texts = [None] * len(texts)
+            for bucket in length_buckets([len(ids) for ids in encoded]):
+                inputs = self._tokenizer.pad(
+                    {"input_ids": [encoded[i] for i in bucket]},
+                    return_tensors="pt"
+                )
+                
+                if torch.cuda.is_available():
+                    inputs = {k: v.cuda() for k, v in inputs.items()}
+                
+                # Generate translations for the whole bucket
+                with torch.no_grad():
+                    generated_tokens = self._model.generate(
+                        **inputs,
+                        forced_bos_token_id=self._forced_bos_id(tgt_lang),
+                        max_length=512,
+                        num_beams=4,
+                        early_stopping=True,
+                        pad_token_id=self._tokenizer.pad_token_id
+                    )
+                
+                decoded = self._tokenizer.batch_decode(
+                    generated_tokens, 
+                    skip_special_tokens=True
+                )
+                for i, translated_text in zip(bucket, decoded):
+                    translated_texts[i] = translated_text
+            
+            return translated_texts
+        
+        translated_texts = await loop.run_in_executor(self._inference_executor, translate_sync)
+        
+        return [
+            ModelResult(
+                predictions=[ModelPrediction(
+                    text=translated_text,
+                    confidence=self._confidence,
+                    metadata={
+                        "source_lang": src_lang,
+                        "target_lang": tgt_lang,
+                        "model_type": self._model_type
+                    }
+                )],
+                model_name=self.model_name,
+                model_version=self.model_version,
+                processing_time=0.0,  # Will be set by caller
+                input_tokens=len(text.split()),
+                output_tokens=len(translated_text.split())
+            )
+            for text, translated_text in zip(texts, translated_texts)
+        ]
+    
+    def _prepare_input(self, text: str, src_lang: str) -> str:
+        """
+        Get the tokenizer input for text in the model's source language.
+        
+        By default the tokenizer adds the source language token itself.
+        Must be called on the inference thread.
+        """
+        self._tokenizer.src_lang = src_lang
+        return text
+    
+    def _forced_bos_id(self, tgt_lang: str) -> Optional[int]:
+        """Get the token ID that starts generation in the target language."""
+        return self._tokenizer.lang_code_to_id[tgt_lang]
+    
+    def _cached_encoder_outputs(self, source_lang: str, text: str, inputs: Dict[str, Any]) -> Any:
+        """
+        Get encoder outputs for tokenized text, running the encoder on a miss.
+        
+        The encoder only sees the source side, so its outputs can be passed
+        to generate() again when the same text is translated into another
+        language, leaving just the decoder to run. Must be called on the
+        inference thread, inside torch.no_grad().
+        
+        Each call returns a new output object: beam search replaces its
+        hidden states with a copy expanded per beam, which must not leak
+        into the cache.
+        """
+        from transformers.modeling_outputs import BaseModelOutput
+        
+        key = (source_lang, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest())
+        hidden_state = self._encoder_cache.get(key)
+        if hidden_state is not None:
+            self._encoder_cache.move_to_end(key)
+        else:
+            encoder_outputs = self._model.get_encoder()(**inputs, return_dict=True)
+            hidden_state = encoder_outputs.last_hidden_state.detach().clone()
+            self._encoder_cache[key] = hidden_state
+            if len(self._encoder_cache) > self.encoder_cache_size:
+                self._encoder_cache.popitem(last=False)
+        return BaseModelOutput(last_hidden_state=hidden_state)
+    
     def supports_language_pair(self, source_lang: str, target_lang: str) -> bool:
         """Check if the model supports the given language pair."""
         return (source_lang in self.supported_languages and 
@@ -159,6 +385,7 @@ class BaseMLModel(ABC):
                 self.is_loaded = False
                 self._model = None
                 self._tokenizer = None
+                self._encoder_cache.clear()
                 logger.info(f"Model {self.model_name} unloaded")
             except Exception as e:
                 logger.error(f"Error unloading model {self.model_name}: {e}")
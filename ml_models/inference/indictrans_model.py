@@ -3,7 +3,7 @@ IndicTrans model implementation for Indian language translation.
 """
 import asyncio
 import torch
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
 import logging
 
@@ -11,10 +11,16 @@ from .base_model import BaseMLModel, ModelResult, ModelPrediction
 
 logger = logging.getLogger(__name__)
 
+# Indian languages IndicTrans can also translate between
+_INDIAN_LANGUAGES = frozenset({"hi", "ta", "te", "bn", "mr"})
+
 
 class IndicTransModel(BaseMLModel):
     """IndicTrans model for English-Indian language translation."""
     
+    _model_type = "indictrans"
+    _confidence = 0.85  # IndicTrans typically has high confidence
+    
     def __init__(self, model_name: str, model_path: str = None):
         super().__init__(model_name, model_path)
         self.supported_languages = {"en", "hi", "ta", "te", "bn", "mr"}
@@ -34,7 +40,7 @@ class IndicTransModel(BaseMLModel):
         """Load IndicTrans model and tokenizer."""
         try:
             # Load in a separate thread to avoid blocking
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             
             def load_sync():
                 tokenizer = AutoTokenizer.from_pretrained(
@@ -77,10 +83,10 @@ class IndicTransModel(BaseMLModel):
                 raise ValueError(f"Language mapping not found for {source_lang}->{target_lang}")
             
             # Prepare input with language tokens
-            input_text = f"{src_lang}: {text}"
+            input_text = self._prepare_input(text, src_lang)
             
-            # Run inference in executor to avoid blocking
-            loop = asyncio.get_event_loop()
+            # Run inference on the model's own thread to avoid blocking
+            loop = asyncio.get_running_loop()
             
             def translate_sync():
                 # Tokenize input
@@ -97,12 +103,15 @@ class IndicTransModel(BaseMLModel):
                 
                 # Generate translation
                 with torch.no_grad():
+                    # Reused when the same text goes to another target language
+                    encoder_outputs = self._cached_encoder_outputs(src_lang, text, inputs)
                     outputs = self._model.generate(
                         **inputs,
+                        encoder_outputs=encoder_outputs,
                         max_length=512,
                         num_beams=4,
                         early_stopping=True,
-                        forced_bos_token_id=self._tokenizer.lang_code_to_id.get(tgt_lang),
+                        forced_bos_token_id=self._forced_bos_id(tgt_lang),
                         pad_token_id=self._tokenizer.pad_token_id
                     )
                 
@@ -114,16 +123,16 @@ class IndicTransModel(BaseMLModel):
                 
                 return translated_texts[0]
             
-            translated_text = await loop.run_in_executor(None, translate_sync)
+            translated_text = await loop.run_in_executor(self._inference_executor, translate_sync)
             
             # Create result
             prediction = ModelPrediction(
                 text=translated_text,
-                confidence=0.85,  # IndicTrans typically has high confidence
+                confidence=self._confidence,
                 metadata={
                     "source_lang": src_lang,
                     "target_lang": tgt_lang,
-                    "model_type": "indictrans"
+                    "model_type": self._model_type
                 }
             )
             
@@ -140,6 +149,24 @@ class IndicTransModel(BaseMLModel):
             logger.error(f"IndicTrans translation error: {e}")
             raise
     
+    async def _translate_batch_impl(
+        self, 
+        texts: List[str], 
+        source_lang: str, 
+        target_lang: str,
+        **kwargs
+    ) -> List[ModelResult]:
+        """Translate texts in length buckets, one generate() call per bucket."""
+        return await self._translate_in_buckets(texts, source_lang, target_lang)
+    
+    def _prepare_input(self, text: str, src_lang: str) -> str:
+        """Prefix text with its language tag, as IndicTrans expects."""
+        return f"{src_lang}: {text}"
+    
+    def _forced_bos_id(self, tgt_lang: str) -> Optional[int]:
+        """Get the target language token ID, if the tokenizer has one."""
+        return self._tokenizer.lang_code_to_id.get(tgt_lang)
+    
     def supports_language_pair(self, source_lang: str, target_lang: str) -> bool:
         """Check if language pair is supported by IndicTrans."""
         # IndicTrans primarily supports English <-> Indian languages
@@ -148,7 +175,6 @@ class IndicTransModel(BaseMLModel):
         if source_lang in self.supported_languages and target_lang == "en":
             return True
         # Also supports some Indian-to-Indian translations
-        if (source_lang in {"hi", "ta", "te", "bn", "mr"} and 
-            target_lang in {"hi", "ta", "te", "bn", "mr"}):
+        if source_lang in _INDIAN_LANGUAGES and target_lang in _INDIAN_LANGUAGES:
             return True
         return False
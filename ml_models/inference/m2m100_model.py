@@ -3,7 +3,7 @@ M2M100 model implementation for multilingual translation.
 """
 import asyncio
 import torch
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from transformers import M2M100ForConditionalGeneration, M2M100Tokenizer
 import logging
 
@@ -15,6 +15,9 @@ logger = logging.getLogger(__name__)
 class M2M100Model(BaseMLModel):
     """M2M100 model for many-to-many multilingual translation."""
     
+    _model_type = "m2m100"
+    _confidence = 0.80  # M2M100 good confidence
+    
     def __init__(self, model_name: str, model_path: str = None):
         super().__init__(model_name, model_path)
         self.supported_languages = {"en", "hi", "ta", "te", "bn", "mr"}
@@ -34,7 +37,7 @@ class M2M100Model(BaseMLModel):
         """Load M2M100 model and tokenizer."""
         try:
             # Load in a separate thread to avoid blocking
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             
             def load_sync():
                 tokenizer = M2M100Tokenizer.from_pretrained(
@@ -74,8 +77,8 @@ class M2M100Model(BaseMLModel):
             if not src_lang or not tgt_lang:
                 raise ValueError(f"Language mapping not found for {source_lang}->{target_lang}")
             
-            # Run inference in executor to avoid blocking
-            loop = asyncio.get_event_loop()
+            # Run inference on the model's own thread to avoid blocking
+            loop = asyncio.get_running_loop()
             
             def translate_sync():
                 # Set source language
@@ -95,9 +98,12 @@ class M2M100Model(BaseMLModel):
                 
                 # Generate translation
                 with torch.no_grad():
+                    # Reused when the same text goes to another target language
+                    encoder_outputs = self._cached_encoder_outputs(src_lang, text, inputs)
                     generated_tokens = self._model.generate(
                         **inputs,
-                        forced_bos_token_id=self._tokenizer.get_lang_id(tgt_lang),
+                        encoder_outputs=encoder_outputs,
+                        forced_bos_token_id=self._forced_bos_id(tgt_lang),
                         max_length=512,
                         num_beams=4,
                         early_stopping=True,
@@ -112,16 +118,16 @@ class M2M100Model(BaseMLModel):
                 
                 return translated_text
             
-            translated_text = await loop.run_in_executor(None, translate_sync)
+            translated_text = await loop.run_in_executor(self._inference_executor, translate_sync)
             
             # Create result
             prediction = ModelPrediction(
                 text=translated_text,
-                confidence=0.80,  # M2M100 good confidence
+                confidence=self._confidence,
                 metadata={
                     "source_lang": src_lang,
                     "target_lang": tgt_lang,
-                    "model_type": "m2m100"
+                    "model_type": self._model_type
                 }
             )
             
@@ -138,6 +144,20 @@ class M2M100Model(BaseMLModel):
             logger.error(f"M2M100 translation error: {e}")
             raise
     
+    async def _translate_batch_impl(
+        self, 
+        texts: List[str], 
+        source_lang: str, 
+        target_lang: str,
+        **kwargs
+    ) -> List[ModelResult]:
+        """Translate texts in length buckets, one generate() call per bucket."""
+        return await self._translate_in_buckets(texts, source_lang, target_lang)
+    
+    def _forced_bos_id(self, tgt_lang: str) -> Optional[int]:
+        """Get the target language token ID."""
+        return self._tokenizer.get_lang_id(tgt_lang)
+    
     def supports_language_pair(self, source_lang: str, target_lang: str) -> bool:
         """Check if language pair is supported by M2M100."""
         # M2M100 supports many-to-many translation for all our languages
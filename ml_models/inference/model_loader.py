@@ -128,20 +128,25 @@ class ModelLoader:
         # Download model from HuggingFace
         logger.info(f"Downloading model {model_name} to cache...")
         try:
-            # Use transformers to download and cache model
-            tokenizer = AutoTokenizer.from_pretrained(
-                model_name,
-                cache_dir=str(model_cache_dir)
-            )
-            model = AutoModelForSeq2SeqLM.from_pretrained(
-                model_name,
-                cache_dir=str(model_cache_dir),
-                torch_dtype=torch.float16 if torch.cuda.is_available() else torch.float32
-            )
+            def download_sync():
+                # Use transformers to download and cache model
+                tokenizer = AutoTokenizer.from_pretrained(
+                    model_name,
+                    cache_dir=str(model_cache_dir)
+                )
+                model = AutoModelForSeq2SeqLM.from_pretrained(
+                    model_name,
+                    cache_dir=str(model_cache_dir),
+                    torch_dtype=torch.float16 if torch.cuda.is_available() else torch.float32
+                )
+                
+                # Save to our cache structure
+                tokenizer.save_pretrained(str(model_cache_dir))
+                model.save_pretrained(str(model_cache_dir))
             
-            # Save to our cache structure
-            tokenizer.save_pretrained(str(model_cache_dir))
-            model.save_pretrained(str(model_cache_dir))
+            # Download in a separate thread so concurrent loads are not serialized
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, download_sync)
             
             logger.info(f"Model {model_type} downloaded and cached successfully")
             return model_cache_dir
@@ -0,0 +1,108 @@
+"""
+Unit tests for the encoder output cache in BaseMLModel.
+
+generate() with beam search replaces the encoder hidden states it is given
+with a copy expanded per beam; these tests check that translating the same
+text again still starts from the unexpanded cached states.
+"""
+
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+from transformers.modeling_outputs import BaseModelOutput
+
+from ml_models.inference.base_model import BaseMLModel, ModelPrediction, ModelResult
+
+
+NUM_BEAMS = 4
+
+
+class StubEncoder:
+    """Encoder returning one hidden state per input token."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, input_ids, attention_mask=None, return_dict=True):
+        self.calls += 1
+        return BaseModelOutput(last_hidden_state=input_ids.unsqueeze(-1).float())
+
+
+class StubNetwork:
+    """Seq2seq network whose generate() expands encoder outputs like beam search."""
+
+    def __init__(self):
+        self.encoder = StubEncoder()
+        self.batch_sizes = []
+
+    def get_encoder(self):
+        return self.encoder
+
+    def generate(self, input_ids, encoder_outputs, num_beams=1, **kwargs):
+        encoder_outputs["last_hidden_state"] = encoder_outputs.last_hidden_state.repeat_interleave(
+            num_beams, dim=0
+        )
+        self.batch_sizes.append(encoder_outputs.last_hidden_state.shape[0])
+        return encoder_outputs.last_hidden_state[::num_beams, :, 0].long()
+
+
+class StubModel(BaseMLModel):
+    """Model translating through StubNetwork with the encoder cache."""
+
+    def __init__(self):
+        super().__init__("stub-model")
+        self.supported_languages = {"en", "hi"}
+
+    async def _load_model_impl(self) -> bool:
+        self._model = StubNetwork()
+        return True
+
+    async def _translate_impl(self, text, source_lang, target_lang, **kwargs) -> ModelResult:
+        input_ids = torch.tensor([[ord(char) for char in text]])
+        with torch.no_grad():
+            encoder_outputs = self._cached_encoder_outputs(source_lang, text, {"input_ids": input_ids})
+            generated = self._model.generate(
+                input_ids=input_ids,
+                encoder_outputs=encoder_outputs,
+                num_beams=NUM_BEAMS
+            )
+        translated_text = "".join(chr(token) for token in generated[0].tolist())
+        return ModelResult(
+            predictions=[ModelPrediction(text=translated_text, confidence=1.0)],
+            model_name=self.model_name,
+            model_version="test",
+            processing_time=0.0
+        )
+
+
+@pytest.fixture
+def stub_model():
+    model = StubModel()
+    model._model = StubNetwork()
+    model.is_loaded = True
+    return model
+
+
+class TestEncoderCache:
+    """Test reuse of cached encoder outputs across generate() calls."""
+
+    @pytest.mark.asyncio
+    async def test_same_text_translated_twice(self, stub_model):
+        """Test that beam expansion does not corrupt the cached outputs."""
+        first = await stub_model._translate_impl("hello", "en", "hi")
+        second = await stub_model._translate_impl("hello", "en", "hi")
+
+        assert first.best_prediction.text == "hello"
+        assert second.best_prediction.text == "hello"
+        assert stub_model._model.encoder.calls == 1
+        assert stub_model._model.batch_sizes == [NUM_BEAMS, NUM_BEAMS]
+
+    @pytest.mark.asyncio
+    async def test_cached_state_is_unexpanded(self, stub_model):
+        """Test that the cache keeps one hidden state row per source text."""
+        await stub_model._translate_impl("hello", "en", "hi")
+
+        (cached,) = stub_model._encoder_cache.values()
+        assert cached.shape == (1, len("hello"), 1)